@@ -0,0 +1,87 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pso.PSO import PSO
+from pso.LeanPSO import LeanPSO
+
+
+def sphere(x):
+    """
+    Cheap objective function, so the time is spent in the engine rather than in the evaluation
+    """
+    total = 0.0
+    for xi in x:
+        total += xi * xi
+    return total
+
+
+def measure(engine, dimension, options, repeat):
+    """
+    Runs the engine on the sphere function
+    Arguments:
+        engine(class): PSO or LeanPSO
+        dimension(int): Dimension of the problem
+        options(PSO.Options): Algorithm options
+        repeat(int): Number of runs
+    Returns:
+        float: Best run time in seconds
+    """
+    best = None
+    for seed in range(repeat):
+        random.seed(seed)
+        start = time.perf_counter()
+        engine(sphere, dimension, options).optimize()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    """
+    Compares the run time of the Particle based PSO engine with the flat buffer LeanPSO engine
+    """
+    parser = argparse.ArgumentParser(description="Speed benchmark of the Particle and the lean PSO engines")
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[2, 10, 30], help="Dimensions of the problem")
+    parser.add_argument("--npart", type=int, default=30, help="Number of particles")
+    parser.add_argument("--niter", type=int, default=200, help="Number of iterations")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs per engine, the best one is reported")
+    args = parser.parse_args()
+    options = PSO.Options()
+    options.npart = args.npart
+    options.niter = args.niter
+    options.log = False
+    print("{:>9} {:>12} {:>12} {:>8}".format("dimension", "Particle", "lean", "speedup"))
+    for dimension in args.dimensions:
+        particle = measure(PSO, dimension, options, args.repeat)
+        lean = measure(LeanPSO, dimension, options, args.repeat)
+        print("{:>9} {:>9.2f} ms {:>9.2f} ms {:>7.2f}x".format(dimension, particle * 1000, lean * 1000,
+                                                              particle / lean))
+
+
+if __name__ == '__main__':
+    main()
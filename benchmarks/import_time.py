@@ -0,0 +1,125 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY = ("matplotlib", "PyQt5", "numpy")
+OPTIONAL = ("pso.Plot",)
+BASELINE = os.path.join(ROOT, "benchmarks", "import_time.json")
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, ",".join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def core_modules():
+    """
+    Returns:
+        list: Names of the modules of the core pso package, without the optional plotting module
+    """
+    paths = glob.glob(os.path.join(ROOT, "pso", "*.py"))
+    names = ["pso." + os.path.splitext(os.path.basename(path))[0] for path in paths]
+    return sorted(name for name in names if name not in OPTIONAL and not name.endswith("__init__"))
+
+
+def measure(module, repeat):
+    """
+    Imports the module in fresh interpreters
+    Arguments:
+        module(str): Name of the module
+        repeat(int): Number of fresh interpreters
+    Returns:
+        tuple: Best import time in seconds and the heavy dependencies which were imported
+    """
+    best = None
+    heavy = ""
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY)], cwd=ROOT,
+                                check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+        elapsed = float(output[0])
+        heavy = output[1] if len(output) > 1 else ""
+        best = elapsed if best is None else min(best, elapsed)
+    return best, heavy
+
+
+def load_baseline(path):
+    """
+    Arguments:
+        path(str): Path of the baseline file
+    Returns:
+        dict: Baseline import time of every module in milliseconds, empty if the file does not exist
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as file:
+        return json.load(file)
+
+
+def main():
+    """
+    Measures the import time of every core module and fails if a module pulls in a GUI or plotting dependency, has
+    no baseline, or takes longer than its baseline times the tolerance plus the slack. With --update the measured
+    times are stored as the new baseline instead
+    """
+    parser = argparse.ArgumentParser(description="Import-time regression benchmark of the core pso package")
+    parser.add_argument("--baseline", default=BASELINE, help="JSON file with the baseline import times in ms")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="Allowed ratio to the baseline import time")
+    parser.add_argument("--slack", type=float, default=1.0, help="Allowed absolute excess over the budget in ms")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of fresh interpreters per module")
+    parser.add_argument("--update", action="store_true", help="Store the measured times as the new baseline")
+    args = parser.parse_args()
+    baseline = load_baseline(args.baseline)
+    measured = {}
+    failed = False
+    for module in core_modules():
+        elapsed, heavy = measure(module, args.repeat)
+        elapsed *= 1000
+        measured[module] = round(elapsed, 2)
+        status = "ok"
+        if heavy:
+            status = "FAIL imports " + heavy
+            failed = True
+        elif args.update:
+            status = "stored"
+        elif module not in baseline:
+            status = "FAIL no baseline"
+            failed = True
+        elif elapsed > baseline[module] * args.tolerance + args.slack:
+            status = "FAIL over budget of {:.2f} ms".format(baseline[module] * args.tolerance + args.slack)
+            failed = True
+        print("{:<24} {:8.2f} ms  {}".format(module, elapsed, status))
+    if args.update:
+        with open(args.baseline, "w") as file:
+            json.dump(measured, file, indent=4, sort_keys=True)
+            file.write("\n")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from PyQt5.QtWidgets import QWidget, QVBoxLayout
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+from matplotlib.figure import Figure
+import numpy as np
+import time
+
+backgrounds = {}
+
+
+def evaluate_point(objfunc, point):
+    """
+    Arguments:
+        objfunc(Function): Objective function
+        point(list): Position
+    Returns:
+        float: Function value, nan where the function cannot be evaluated (e.g. log of a negative number)
+    """
+    try:
+        return float(objfunc(point))
+    except (ArithmeticError, ValueError, TypeError):
+        return np.nan
+
+
+def contour_grid(objfunc, name, dimension, bounds, resolution=120):
+    """
+    Evaluates the objective function on a grid over the first two coordinates, the remaining coordinates are fixed
+    at the center of the bounds. The whole grid is evaluated as one batch and cached per function, dimension, bounds
+    and resolution. Grid points where the function cannot be evaluated are left blank
+    Arguments:
+        objfunc(Function): Objective function
+        name(str): Name of the objective function
+        dimension(int): Dimension of the problem
+        bounds(tuple): Lower and upper bound of every coordinate
+        resolution(int): Number of grid points along each axis
+    Returns:
+        tuple: Grid coordinates X, Y and function values Z
+    """
+    key = (name, dimension, bounds, resolution)
+    if key not in backgrounds:
+        low, high = bounds
+        axis = np.linspace(low, high, resolution)
+        x, y = np.meshgrid(axis, axis)
+        points = np.full((resolution * resolution, dimension), (low + high) / 2)
+        points[:, 0] = x.ravel()
+        points[:, 1] = y.ravel()
+        batch = getattr(objfunc, "batch", None)
+        try:
+            values = np.asarray(batch(points.tolist()) if batch else [objfunc(point) for point in points.tolist()],
+                                dtype=float)
+        except (ArithmeticError, ValueError, TypeError):
+            values = np.fromiter((evaluate_point(objfunc, point) for point in points.tolist()), dtype=float,
+                                 count=len(points))
+        backgrounds[key] = (x, y, values.reshape(resolution, resolution))
+    return backgrounds[key]
+
+
+class LiveView(QWidget):
+    """
+    Embedded live view of the swarm. The contour of the objective function is drawn once and kept as a cached
+    background, every frame only restores the background and blits the particle markers.
+    emit: function which passes the particle positions and the global best position from the optimizer thread to the
+    GUI thread, usually a signal's emit
+    """
+    def __init__(self, emit, fps=20):
+        super(LiveView, self).__init__()
+        self.emit = emit
+        self.figure = Figure(figsize=(4, 4), tight_layout=True)
+        self.canvas = FigureCanvasQTAgg(self.figure)
+        self.axes = self.figure.add_subplot(111)
+        self.particles = None
+        self.best = None
+        self.background = None
+        self.interval = 1.0 / fps
+        self.last_frame = 0.0
+        self.pending = False
+        self.canvas.mpl_connect("draw_event", self.capture_background)
+
+        v_box = QVBoxLayout()
+        v_box.addWidget(self.canvas)
+        self.setLayout(v_box)
+
+    def prepare(self, objfunc, name, dimension, options):
+        """
+        Draws the contour background of the objective function, must be called from the GUI thread
+        Arguments:
+            objfunc(Function): Objective function
+            name(str): Name of the objective function
+            dimension(int): Dimension of the problem
+            options(PSO.Options): Algorithm options, the initial population bounds define the plotted area
+        """
+        bounds = (options.initoffset - options.initspan, options.initoffset + options.initspan)
+        x, y, z = contour_grid(objfunc, name, dimension, bounds)
+        self.axes.clear()
+        self.axes.contourf(x, y, z, levels=40, cmap="viridis")
+        self.axes.set_xlim(bounds)
+        self.axes.set_ylim(bounds)
+        title = "{} function".format(name) if dimension == 2 else "{} function (x1, x2 projection)".format(name)
+        self.axes.set_title(title)
+        self.particles = self.axes.scatter([], [], s=12, c="white", edgecolors="black", animated=True)
+        self.best = self.axes.scatter([], [], s=60, c="red", marker="*", animated=True)
+        self.last_frame = 0.0
+        self.pending = False
+        self.canvas.draw()
+
+    def capture_background(self, event=None):
+        """
+        Caches the rendered contour, called after every full redraw of the canvas
+        """
+        self.background = self.canvas.copy_from_bbox(self.axes.bbox)
+        self.draw_markers()
+
+    def observe(self, iteration, pso):
+        """
+        PSO observer which runs in the optimizer thread. It throttles the frames to the frame rate and drops frames
+        while the previous one has not been drawn, so rendering never slows the optimizer down
+        Arguments:
+            iteration(int): Current iteration
+            pso(PSO): Running algorithm
+        """
+        now = time.monotonic()
+        if self.pending or now - self.last_frame < self.interval:
+            return
+        self.last_frame = now
+        self.pending = True
+        self.emit([particle.position[:2] for particle in pso.particles], pso.global_best_position[:2])
+
+    def show_frame(self, positions, global_best_position):
+        """
+        Blits a frame, must be called from the GUI thread
+        Arguments:
+            positions(list): Positions of the particles projected to the first two coordinates
+            global_best_position(list): Global best position projected to the first two coordinates
+        """
+        if self.particles is None:
+            self.pending = False
+            return
+        self.particles.set_offsets(np.asarray(positions, dtype=float).reshape(-1, 2))
+        self.best.set_offsets(np.asarray([global_best_position], dtype=float))
+        self.draw_markers()
+        self.pending = False
+
+    def draw_markers(self):
+        """
+        Restores the cached background and blits the particle markers over it
+        """
+        if self.background is None or self.particles is None:
+            return
+        self.canvas.restore_region(self.background)
+        self.axes.draw_artist(self.particles)
+        self.axes.draw_artist(self.best)
+        self.canvas.blit(self.axes.bbox)
@@ -18,16 +18,15 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
-from PyQt5 import Qt
-from PyQt5.Qt import *
+from PyQt5.QtWidgets import QMainWindow, QScrollArea, QDockWidget, QMessageBox
 from PyQt5.QtGui import QTextCursor
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import Qt, pyqtSignal
 from gui.OptionsWindow import OptionsWindow
 from gui.LogWindow import LogWindow
 from pso.PSO import PSO
 from pso.Benchmark import benchmark, ackley, griewank, michalewicz
+from pso.Expression import compile_expression
 import threading
-import matplotlib.pyplot as plt
 from math import inf
 
 
@@ -40,6 +39,7 @@ class MainWindow(QMainWindow):
     text_update_needed = pyqtSignal(str)
     error_message = pyqtSignal(str)
     plot_requested = pyqtSignal(PSO.Options, list, str)
+    frame_ready = pyqtSignal(list, list)
 
     def __init__(self):
         super(MainWindow, self).__init__()
@@ -48,6 +48,8 @@ class MainWindow(QMainWindow):
         self.text_update_needed.connect(self.update_text)
         self.error_message.connect(self.show_error_message)
         self.plot_requested.connect(self.show_plot)
+        self.live_view = None
+        self.live_dock = None
 
         self.options_window = OptionsWindow()
         self.scroll_area = QScrollArea()
@@ -92,19 +94,61 @@ class MainWindow(QMainWindow):
 
     def create_options(self):
         """
-        Starts the optimization process. Plots a graph if plot option is enabled
+        Reads the objective function and the options, prepares the live view if it is enabled and starts the
+        optimization process in a new thread. Runs in the GUI thread, so the live view is ready before the first frame.
+        A custom expression is only checked when it is compiled, an expression which fails at some points is reported
+        by the optimization process if the swarm reaches them
         """
         dimension = self.options_window.spin_box.value()
-        objfunc = self.functions[self.options_window.combo_box.currentIndex()]
-        function = self.options_window.combo_box.currentText()
+        index = self.options_window.combo_box.currentIndex()
+        if index < len(self.functions):
+            objfunc = self.functions[index]
+            function = self.options_window.combo_box.currentText()
+        else:
+            function = self.options_window.expression_input.text().strip()
+            try:
+                objfunc = compile_expression(function)
+            except ValueError as error:
+                self.error_message.emit("Invalid expression: {}".format(error))
+                return
         options = self.load_options()
         if not options:
             return
+        observer = None
+        if self.options_window.live_box.isChecked():
+            try:
+                self.prepare_live_view(objfunc, function, dimension, options)
+            except ImportError as error:
+                self.error_message.emit("Live view is not available: {}".format(error))
+                return
+            observer = self.live_observer
         self.text_update_needed.emit("Optimization process started. Please wait...")
         self.log_window.run_btn.setDisabled(True)
         self.log_window.clear_btn.setDisabled(True)
+        c_thread = threading.Thread(target=self.run_optimization,
+                                    args=(objfunc, function, dimension, options, observer))
+        c_thread.start()
 
-        global_best, global_best_position, history = benchmark(objfunc, dimension, options, self.log_pso_algorithm)
+    def run_optimization(self, objfunc, function, dimension, options, observer):
+        """
+        Runs the optimization process in the optimizer thread. Plots a graph if plot option is enabled
+        Arguments:
+            objfunc(Function): Objective function
+            function(str): Name of the objective function
+            dimension(int): Dimension of the problem
+            options(PSO.Options): Options used for the optimization
+            observer(Function): PSO observer, None if the live view is disabled
+        """
+        try:
+            global_best, global_best_position, history = benchmark(objfunc, dimension, options,
+                                                                   self.log_pso_algorithm, observer)
+        except (ArithmeticError, ValueError, TypeError) as error:
+            self.text_update_needed.emit("Optimization process failed.")
+            self.error_message.emit("Objective function could not be evaluated: {}".format(error))
+            return
+        finally:
+            self.log_window.run_btn.setEnabled(True)
+            self.log_window.clear_btn.setEnabled(True)
         self.text_update_needed.emit("Optimization process finished.")
         self.text_update_needed.emit("\nf(x*) = {}".format(global_best))
         self.text_update_needed.emit("\nx* = \n")
@@ -114,9 +158,6 @@ class MainWindow(QMainWindow):
         if options.plot:
             self.plot_requested.emit(options, history, function)
 
-        self.log_window.run_btn.setEnabled(True)
-        self.log_window.clear_btn.setEnabled(True)
-
     def show_plot(self, options, history, function):
         """
         Creates a plot which shows global optimum throughout the iterations of the optimization process
@@ -125,11 +166,39 @@ class MainWindow(QMainWindow):
             history(list): List of global optimums throughout the iterations
             function(str): Name of the objective function
         """
-        plt.scatter([_ for _ in range(1, options.niter + 1)], history, marker='x')
-        plt.title("{} function".format(function))
-        plt.xlabel("Iteration")
-        plt.ylabel("Global best")
-        plt.show()
+        from pso.Plot import plot_history
+        plot_history(history, function)
+
+    def prepare_live_view(self, objfunc, function, dimension, options):
+        """
+        Creates the live view dock on first use and draws the contour of the objective function, must be called from
+        the GUI thread before the optimization starts
+        Arguments:
+            objfunc(Function): Objective function
+            function(str): Name of the objective function
+            dimension(int): Dimension of the problem
+            options(PSO.Options): Options used for the optimization
+        """
+        if self.live_view is None:
+            from gui.LiveView import LiveView
+            self.live_view = LiveView(self.frame_ready.emit)
+            self.frame_ready.connect(self.live_view.show_frame)
+            self.live_dock = QDockWidget("Live view", self)
+            self.live_dock.setWidget(self.live_view)
+            self.live_dock.setFeatures(QDockWidget.NoDockWidgetFeatures)
+            self.live_dock.setMinimumWidth(400)
+            self.addDockWidget(Qt.LeftDockWidgetArea, self.live_dock)
+        self.live_dock.show()
+        self.live_view.prepare(objfunc, function, dimension, options)
+
+    def live_observer(self, iteration, pso):
+        """
+        PSO observer which forwards throttled frames to the live view, runs in the optimizer thread
+        Arguments:
+            iteration(int): Current iteration
+            pso(PSO): Running algorithm
+        """
+        self.live_view.observe(iteration, pso)
 
     def show_error_message(self, text, title="Invalid parameter value"):
         """
@@ -256,5 +325,4 @@ class MainWindow(QMainWindow):
         Event handler for run button click. Starts a new thread which runs the optimization process
         """
         self.log_window.text_area.clear()
-        c_thread = threading.Thread(target=self.create_options)
-        c_thread.start()
+        self.create_options()
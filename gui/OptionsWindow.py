@@ -202,13 +202,22 @@ class OptionsWindow(QWidget):
         self.plot_box.setChecked(self.options.plot)
         self.log_box = QCheckBox("Log")
         self.log_box.setChecked(self.options.log)
+        self.live_box = QCheckBox("Live view")
         h10.addWidget(self.plot_box)
         h10.addWidget(self.log_box)
+        h10.addWidget(self.live_box)
 
         self.combo_box = QComboBox()
         self.combo_box.addItem("Ackley")
         self.combo_box.addItem("Griewank")
         self.combo_box.addItem("Michalewicz")
+        self.combo_box.addItem("Custom")
+
+        self.expression_input = QLineEdit()
+        self.expression_input.setPlaceholderText("e.g. sum(x**2) + prod(cos(x))")
+        self.expression_input.setDisabled(True)
+        self.combo_box.currentTextChanged.connect(
+            lambda text: self.expression_input.setDisabled(text != "Custom"))
 
         self.spin_box = QSpinBox()
         self.spin_box.setMinimum(2)
@@ -222,6 +231,7 @@ class OptionsWindow(QWidget):
 
         v_box.addWidget(QLabel("Function"))
         v_box.addWidget(self.combo_box)
+        v_box.addWidget(self.expression_input)
         v_box.addWidget(separators[10])
 
         v_box.addWidget(QLabel("Dimension"))
@@ -18,7 +18,7 @@
     along with this program.  If not, see <https://www.gnu.org/licenses/>
 """
 
-from PyQt5.Qt import QApplication
+from PyQt5.QtWidgets import QApplication
 from gui.MainWindow import MainWindow
 import sys
 
@@ -0,0 +1,305 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from math import inf, nan
+from pso.PSO import PSO
+from pso.LeanPSO import LeanPSO
+import argparse
+import ast
+import copy
+import json
+import random
+import time
+
+TARGETS = (1e1, 1e-1, 1e-3, 1e-5, 1e-8)
+
+engines = {
+    "pso": PSO,
+    "lean": LeanPSO
+}
+
+
+def run(name, dimension, options, seed, targets=TARGETS, instance=None, engine="pso"):
+    """
+    Runs one seeded optimization of a registered benchmark function and records the number of evaluations and the
+    wall time at which the error to the optimum first reached every target precision. Targets which are only reached
+    outside of the iterations (the final local search, the iteration cut short by a budget) are credited with the
+    totals of the run
+    Arguments:
+        name(str): Name of the benchmark function, see pso.Functions
+        dimension(int): Dimension of the problem
+        options(PSO.Options): Algorithm options, copied for the run
+        seed(int): Seed of the run
+        targets(tuple): Target precisions
+        instance(int): Seed of the shifted and rotated variant, None runs the plain function
+        engine(str): Name of the optimization engine, see engines
+    Returns:
+        dict: Run record with the total evaluations and time, the final error and the hits, a list with
+              [evaluations, seconds] or None for every target
+    """
+    from pso.Functions import get
+    if engine not in engines:
+        raise ValueError("Unknown engine '{}'. Available engines: {}.".format(engine, ", ".join(engines)))
+    objfunc = get(name, dimension, instance)
+    if objfunc.optimum(dimension) is None:
+        raise ValueError("Optimum of {} is not known for dimension {}.".format(name, dimension))
+    opts = copy.copy(options)
+    objfunc.configure(opts)
+    opts.log = False
+    opts.plot = False
+    hits = [None]*len(targets)
+    start = time.perf_counter()
+
+    def observe(iteration, pso):
+        error = objfunc.error(pso.global_best, dimension)
+        for k, target in enumerate(targets):
+            if hits[k] is None and error <= target:
+                hits[k] = [pso.evaluations + pso.local_evaluations, time.perf_counter() - start]
+
+    random.seed(seed)
+    result = engines[engine](objfunc, dimension, opts).optimize(None, observe)
+    elapsed = time.perf_counter() - start
+    evaluations = result.evaluations + result.local_evaluations
+    error = objfunc.error(result[0], dimension)
+    for k, target in enumerate(targets):
+        if hits[k] is None and error <= target:
+            hits[k] = [evaluations, elapsed]
+    return {
+        "function": name,
+        "dimension": dimension,
+        "instance": instance,
+        "seed": seed,
+        "evaluations": evaluations,
+        "time": elapsed,
+        "error": error,
+        "hits": hits
+    }
+
+
+def campaign(functions, dimensions, options, seeds, targets=TARGETS, instance=None, label="pso", logfunc=None,
+             engine="pso"):
+    """
+    Runs every seed for every (function, dimension) pair
+    Arguments:
+        functions(list): Names of the benchmark functions
+        dimensions(list): Dimensions
+        options(PSO.Options): Algorithm options of the configuration
+        seeds(int): Number of seeds per (function, dimension)
+        targets(tuple): Target precisions
+        instance(int): Seed of the shifted and rotated variants, None runs the plain functions
+        label(str): Name of the configuration
+        logfunc(Function): Function which is called with every finished run record
+        engine(str): Name of the optimization engine, see engines
+    Returns:
+        dict: Campaign with the configuration label, the engine, the targets and the run records
+    """
+    runs = []
+    for name in functions:
+        for dimension in dimensions:
+            for seed in range(seeds):
+                record = run(name, dimension, options, seed, targets, instance, engine)
+                runs.append(record)
+                if logfunc:
+                    logfunc(record)
+    return {"label": label, "engine": engine, "targets": list(targets), "options": vars(options).copy(), "runs": runs}
+
+
+def group(results):
+    """
+    Arguments:
+        results(dict): Campaign
+    Returns:
+        dict: Run records grouped by (function, dimension)
+    """
+    groups = {}
+    for record in results["runs"]:
+        groups.setdefault((record["function"], record["dimension"]), []).append(record)
+    return groups
+
+
+def ert(runs, k):
+    """
+    Expected running time: the evaluations spent by all the runs until they hit target k, or until they ended if
+    they never did, divided by the number of runs which hit the target
+    Arguments:
+        runs(list): Run records of one (function, dimension)
+        k(int): Index of the target
+    Returns:
+        tuple: Expected running time in evaluations (inf if no run hit the target), expected wall time in seconds and
+               the success rate
+    """
+    successes = 0
+    evaluations = 0
+    seconds = 0.0
+    for record in runs:
+        hit = record["hits"][k]
+        if hit:
+            successes += 1
+            evaluations += hit[0]
+            seconds += hit[1]
+        else:
+            evaluations += record["evaluations"]
+            seconds += record["time"]
+    if not successes:
+        return inf, inf, 0.0
+    return evaluations / successes, seconds / successes, successes / len(runs)
+
+
+def ecdf(runs, budgets):
+    """
+    Empirical cumulative distribution of the runtime: fraction of (run, target) pairs hit within every budget
+    Arguments:
+        runs(list): Run records
+        budgets(list): Evaluation budgets
+    Returns:
+        list: Fraction of the (run, target) pairs hit within every budget
+    """
+    hits = sorted(hit[0] for record in runs for hit in record["hits"] if hit)
+    total = sum(len(record["hits"]) for record in runs)
+    fractions = []
+    i = 0
+    for budget in budgets:
+        while i < len(hits) and hits[i] <= budget:
+            i += 1
+        fractions.append(i / total if total else 0.0)
+    return fractions
+
+
+def summary(results):
+    """
+    Arguments:
+        results(dict): Campaign
+    Returns:
+        dict: For every (function, dimension) the ERT, expected wall time and success rate of every target
+    """
+    return {key: [ert(runs, k) for k in range(len(results["targets"]))] for key, runs in group(results).items()}
+
+
+def write(results, path):
+    """
+    Writes the campaign as compact JSON
+    Arguments:
+        results(dict): Campaign
+        path(str): Output file
+    """
+    with open(path, "w") as file:
+        json.dump(results, file, separators=(",", ":"), default=str)
+
+
+def load(path):
+    """
+    Arguments:
+        path(str): Campaign file written by write
+    Returns:
+        dict: Campaign
+    """
+    with open(path) as file:
+        return json.load(file)
+
+
+def report(results, budgets=None):
+    """
+    Arguments:
+        results(dict): Campaign
+        budgets(list): Evaluation budgets of the ECDF, if None powers of ten up to the largest run
+    Returns:
+        str: ERT, success rate and ECDF table of the campaign
+    """
+    targets = results["targets"]
+    if budgets is None:
+        budgets = [10 ** k for k in range(1, len(str(max(r["evaluations"] for r in results["runs"]))) + 1)]
+    lines = ["Configuration: {}, engine: {}".format(results["label"], results.get("engine", "pso"))]
+    for (name, dimension), values in sorted(summary(results).items()):
+        lines.append("{} d={}".format(name, dimension))
+        for target, (evaluations, seconds, rate) in zip(targets, values):
+            lines.append("  target {:8.0e}  ERT {:>12.1f} evals  {:>10.4f} s  success {:6.1%}".format(
+                target, evaluations, seconds, rate))
+    lines.append("ECDF  " + "  ".join("{:>8}".format(b) for b in budgets))
+    lines.append("      " + "  ".join("{:8.1%}".format(f) for f in ecdf(results["runs"], budgets)))
+    return "\n".join(lines)
+
+
+def compare(a, b):
+    """
+    Compares the expected running times of two campaigns with the same targets
+    Arguments:
+        a(dict): Baseline campaign
+        b(dict): Candidate campaign
+    Returns:
+        str: Comparison table, a ratio below 1 means the candidate needs fewer evaluations
+    """
+    if a["targets"] != b["targets"]:
+        raise ValueError("Campaigns use different targets.")
+    first = summary(a)
+    second = summary(b)
+    lines = ["{} (A) vs {} (B)".format(a["label"], b["label"]),
+             "{:<24} {:>8} {:>12} {:>12} {:>8} {:>7} {:>7}".format(
+                 "function", "target", "ERT A", "ERT B", "B/A", "succ A", "succ B")]
+    for key in sorted(set(first) & set(second)):
+        for target, x, y in zip(a["targets"], first[key], second[key]):
+            if x[0] == inf:
+                ratio = nan if y[0] == inf else 0.0
+            else:
+                ratio = y[0] / x[0] if x[0] else inf
+            lines.append("{:<24} {:8.0e} {:12.1f} {:12.1f} {:8.3f} {:7.1%} {:7.1%}".format(
+                "{} d={}".format(*key), target, x[0], y[0], ratio, x[2], y[2]))
+    return "\n".join(lines)
+
+
+def main():
+    """
+    Command line interface, e.g.
+    python -m pso.Anytime run ackley,rastrigin 2,5 --seeds 15 --set schedule='"cosine"' --output cosine.json
+    python -m pso.Anytime compare linear.json cosine.json
+    """
+    parser = argparse.ArgumentParser(description="Anytime (ERT) benchmarking of PSO configurations")
+    commands = parser.add_subparsers(dest="command")
+    run_parser = commands.add_parser("run", help="Run a benchmarking campaign")
+    run_parser.add_argument("functions", help="Comma separated benchmark functions")
+    run_parser.add_argument("dimensions", help="Comma separated dimensions")
+    run_parser.add_argument("--seeds", type=int, default=15)
+    run_parser.add_argument("--instance", type=int, default=None, help="Seed of the shifted and rotated variants")
+    run_parser.add_argument("--set", action="append", default=[], help="Option override as name=python-literal")
+    run_parser.add_argument("--label", default="pso")
+    run_parser.add_argument("--engine", default="pso", choices=sorted(engines))
+    run_parser.add_argument("--output", required=True)
+    compare_parser = commands.add_parser("compare", help="Compare two campaigns")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("candidate")
+    args = parser.parse_args()
+    if args.command == "run":
+        options = PSO.Options()
+        for assignment in args.set:
+            name, _, value = assignment.partition("=")
+            if not hasattr(options, name):
+                parser.error("Unknown option '{}'.".format(name))
+            setattr(options, name, ast.literal_eval(value))
+        results = campaign(args.functions.split(","), [int(d) for d in args.dimensions.split(",")], options,
+                           args.seeds, instance=args.instance, label=args.label, engine=args.engine)
+        write(results, args.output)
+        print(report(results))
+    elif args.command == "compare":
+        print(compare(load(args.baseline), load(args.candidate)))
+    else:
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -20,7 +20,6 @@
 
 from math import sin, cos, exp, pi, sqrt
 from pso.PSO import PSO
-import matplotlib.pyplot as plt
 
 
 def ackley(x):
@@ -114,11 +113,8 @@ def benchmark_ackley():
     print("Gopt: {}".format(result[0]))
     print("Position: {}".format(result[1]))
     if options.plot:
-        plt.scatter([_ for _ in range(1, options.niter + 1)], result[2], marker='x')
-        plt.title("Ackley function")
-        plt.xlabel("Iteration")
-        plt.ylabel("Global best")
-        plt.show()
+        from pso.Plot import plot_history
+        plot_history(result[2], "Ackley")
 
 
 def benchmark_griewank():
@@ -155,11 +151,8 @@ def benchmark_griewank():
     print("Gopt: {}".format(result[0]))
     print("Position: {}".format(result[1]))
     if options.plot:
-        plt.scatter([_ for _ in range(1, options.niter + 1)], result[2], marker='x')
-        plt.title("Griewank function")
-        plt.xlabel("Iteration")
-        plt.ylabel("Global best")
-        plt.show()
+        from pso.Plot import plot_history
+        plot_history(result[2], "Griewank")
 
 
 def benchmark_michalewicz():
@@ -205,14 +198,11 @@ def benchmark_michalewicz():
     print("Gopt: {}".format(result[0]))
     print("Position: {}".format(result[1]))
     if options.plot:
-        plt.scatter([_ for _ in range(1, options.niter + 1)], result[2], marker='x')
-        plt.title("Michalewicz function")
-        plt.xlabel("Iteration")
-        plt.ylabel("Global best")
-        plt.show()
+        from pso.Plot import plot_history
+        plot_history(result[2], "Michalewicz")
 
 
-def benchmark(objfunc, dimension, options, logfunc=None):
+def benchmark(objfunc, dimension, options, logfunc=None, observer=None):
     """
     Minimizes objfunc using PSO algorithm
     Arguments:
@@ -220,16 +210,41 @@ def benchmark(objfunc, dimension, options, logfunc=None):
         dimension(int): Dimension of the problem, number of variables
         options(PSO.Options): Algorithm options
         logfunc(Function): Callback function which is called every 10 iterations if options.log is enabled
+        observer(Function): Callback function which is called after every iteration with the iteration and the PSO
     Returns:
         result[0](float): Global optimum of the objective function
         result[1](list): Position of the global optimum
         result[2](list): List of all the global bests throughout the iterations
     """
     pso = PSO(objfunc, dimension, options)
-    result = pso.optimize(logfunc)
+    result = pso.optimize(logfunc, observer)
     return result[0], result[1], result[2]
 
 
+def benchmark_function(name, dimension, options, seed=None, logfunc=None):
+    """
+    Minimizes a registered benchmark function, the initial population covers the function's bounds
+    Arguments:
+        name(str): Name of the benchmark function, see pso.Functions
+        dimension(int): Dimension of the problem, number of variables
+        options(PSO.Options): Algorithm options, copied before the bounds of the function are applied
+        seed(int): Seed of the shifted and rotated variant, None optimizes the plain function
+        logfunc(Function): Callback function which is called every 10 iterations if options.log is enabled
+    Returns:
+        result[0](float): Global optimum of the objective function
+        result[1](list): Position of the global optimum
+        result[2](list): List of all the global bests throughout the iterations
+        result[3](float): Error to the known optimum, None if the optimum is not known
+    """
+    from pso.Functions import get
+    from copy import copy
+    objfunc = get(name, dimension, seed)
+    options = copy(options)
+    objfunc.configure(options)
+    global_best, global_best_position, history = benchmark(objfunc, dimension, options, logfunc)
+    return global_best, global_best_position, history, objfunc.error(global_best, dimension)
+
+
 if __name__ == '__main__':
     benchmark_ackley()
     benchmark_griewank()
@@ -0,0 +1,112 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from math import ceil, inf, sqrt
+import time
+
+
+def swarm_size(maxevals, dimension):
+    """
+    Sizes the swarm for an evaluation budget: the usual 10 + 2*sqrt(dimension) particles, shrunk when the budget is too
+    small to give them at least 20 iterations and grown with the square root of a generous budget
+    Arguments:
+        maxevals(int): Maximum number of objective function evaluations
+        dimension(int): Dimension of the problem
+    Returns:
+        int: Number of particles
+    """
+    npart = max(int(10 + 2 * sqrt(dimension)), int(sqrt(maxevals) / 4))
+    return max(2, min(npart, maxevals // 20))
+
+
+def iterations(options):
+    """
+    Returns the number of iterations the coefficient schedules span. With options.maxevals it is the number of
+    iterations the budget allows after the initial evaluation of the swarm, otherwise options.niter
+    Arguments:
+        options(PSO.Options): Algorithm options
+    Returns:
+        int: Number of iterations
+    """
+    if not options.maxevals:
+        return options.niter
+    return max(1, int(ceil((options.maxevals - options.npart) / options.npart)))
+
+
+class Budget(object):
+
+    def __init__(self, maxevals=None, deadline=None):
+        """
+        Evaluation and wall-clock budget of a run, the clock starts when the budget is created
+        Arguments:
+            maxevals(int): Maximum number of objective function evaluations, None for no limit
+            deadline(float): Maximum run time in seconds, None for no limit
+        """
+        self.maxevals = maxevals
+        self.deadline = deadline
+        self.start = time.perf_counter()
+        self.end = self.start + deadline if deadline is not None else inf
+
+    def remaining(self, evaluations):
+        """
+        Returns the number of evaluations which are left
+        Arguments:
+            evaluations(int): Number of evaluations spent so far
+        Returns:
+            int: Number of evaluations left, inf if the evaluations are not limited
+        """
+        if self.maxevals is None:
+            return inf
+        return max(self.maxevals - evaluations, 0)
+
+    def exhausted(self, evaluations):
+        """
+        Checks whether the budget has run out
+        Arguments:
+            evaluations(int): Number of evaluations spent so far
+        Returns:
+            bool: True if the evaluations are spent or the deadline has passed
+        """
+        if self.maxevals is not None and evaluations >= self.maxevals:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.end
+
+    def expired(self):
+        """
+        Checks the wall-clock part of the budget only
+        Returns:
+            bool: True if the deadline has passed, always False without a deadline
+        """
+        return time.perf_counter() >= self.end
+
+    def progress(self, evaluations):
+        """
+        Returns the fraction of the budget which has been spent, the larger of the evaluation and the time fraction
+        Arguments:
+            evaluations(int): Number of evaluations spent so far
+        Returns:
+            float: Fraction of the budget spent, between 0 and 1
+        """
+        fraction = 0.0
+        if self.maxevals:
+            fraction = evaluations / self.maxevals
+        if self.deadline:
+            fraction = max(fraction, (time.perf_counter() - self.start) / self.deadline)
+        return min(fraction, 1.0)
@@ -0,0 +1,468 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from struct import Struct
+from pso.Evaluator import Evaluator, evaluate_batch
+import argparse
+import importlib
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+REQUEST = Struct("<4sII")
+RESPONSE = Struct("<4sI")
+
+
+def pack(values):
+    """
+    Packs floats into little-endian float64 bytes
+    Arguments:
+        values(iterable): Floats to pack
+    Returns:
+        bytes: Packed floats
+    """
+    data = array("d", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def unpack(payload):
+    """
+    Unpacks little-endian float64 bytes
+    Arguments:
+        payload(bytes): Packed floats
+    Returns:
+        array: Unpacked floats
+    """
+    data = array("d")
+    data.frombytes(payload)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+
+def receive(sock, size):
+    """
+    Receives exactly size bytes from the socket
+    Arguments:
+        sock(socket): Connected socket
+        size(int): Number of bytes
+    Returns:
+        bytearray: Received bytes, empty if the peer closed the connection before sending anything
+    """
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if not n:
+            if received:
+                raise ConnectionError("Connection closed in the middle of a message.")
+            return bytearray()
+        received += n
+    return buffer
+
+
+def connect(address, timeout):
+    """
+    Opens a connection to a worker
+    Arguments:
+        address(tuple|str): (host, port) of a TCP worker or the path of a Unix socket worker
+        timeout(float): Connection timeout in seconds
+    Returns:
+        socket: Connected socket
+    """
+    if isinstance(address, str):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(address)
+    else:
+        sock = socket.create_connection(address, timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.settimeout(None)
+    return sock
+
+
+class WorkerHandler(socketserver.BaseRequestHandler):
+
+    def handle(self):
+        """
+        Serves batch evaluation requests on one persistent connection until the client disconnects. An exception
+        raised by the objective function is sent back as an error frame and the connection stays open
+        """
+        if self.request.family != getattr(socket, "AF_UNIX", None):
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        objfunc = self.server.objfunc
+        while True:
+            try:
+                header = receive(self.request, REQUEST.size)
+            except OSError:
+                return
+            if not header:
+                return
+            magic, count, dimension = REQUEST.unpack(header)
+            if magic != b"EVAL":
+                return
+            flat = unpack(receive(self.request, count * dimension * 8))
+            positions = [flat[i * dimension:(i + 1) * dimension].tolist() for i in range(count)]
+            try:
+                response = RESPONSE.pack(b"VALS", count) + pack(evaluate_batch(objfunc, positions))
+            except Exception as error:
+                message = "{}: {}".format(type(error).__name__, error).encode("utf-8")
+                response = RESPONSE.pack(b"ERRS", len(message)) + message
+            self.request.sendall(response)
+
+
+class Worker(object):
+
+    def __init__(self, objfunc, address):
+        """
+        Evaluation worker which serves batches of positions over a TCP or a Unix socket
+        Arguments:
+            objfunc(Function): Objective function
+            address(tuple|str): (host, port) to listen on, port 0 picks a free port, or the path of a Unix socket
+        """
+        if isinstance(address, str):
+            self.server = socketserver.ThreadingUnixStreamServer(address, WorkerHandler)
+            self.address = address
+        else:
+            self.server = socketserver.ThreadingTCPServer(address, WorkerHandler)
+            self.address = self.server.server_address[:2]
+        self.server.daemon_threads = True
+        self.server.objfunc = objfunc
+        self.thread = None
+
+    def start(self):
+        """
+        Serves in a background thread
+        Returns:
+            Worker: The worker itself
+        """
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def serve_forever(self):
+        """
+        Serves in the calling thread
+        """
+        self.server.serve_forever()
+
+    def stop(self):
+        """
+        Stops serving and closes the listening socket
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class Connection(object):
+
+    def __init__(self, address, timeout):
+        """
+        Persistent connection to a worker which also tracks the worker's measured throughput
+        Arguments:
+            address(tuple|str): Address of the worker
+            timeout(float): Connection timeout in seconds
+        """
+        self.address = address
+        self.timeout = timeout
+        self.sock = None
+        self.throughput = None
+        self.busy = False
+        self.retry_at = 0.0
+        self.lock = threading.Lock()
+
+    def alive(self, now, retry):
+        """
+        Reconnects a failed connection once its retry delay has passed
+        Arguments:
+            now(float): Current monotonic time
+            retry(float): Delay between reconnection attempts in seconds
+        Returns:
+            bool: True if the connection is usable
+        """
+        if self.sock is None and now >= self.retry_at:
+            try:
+                self.sock = connect(self.address, self.timeout)
+            except OSError:
+                self.retry_at = now + retry
+        return self.sock is not None
+
+    def request(self, positions, dimension):
+        """
+        Sends a batch of positions and waits for their values
+        Arguments:
+            positions(list): Positions to evaluate
+            dimension(int): Dimension of the positions
+        Returns:
+            array: Objective function values
+        Raises:
+            RuntimeError: The objective function raised on the worker, the connection stays usable
+        """
+        sock = self.sock
+        if sock is None:
+            raise ConnectionError("Connection to {} is closed.".format(self.address))
+        start = time.monotonic()
+        flat = [x for position in positions for x in position]
+        sock.sendall(REQUEST.pack(b"EVAL", len(positions), dimension) + pack(flat))
+        header = receive(sock, RESPONSE.size)
+        if not header:
+            raise ConnectionError("Worker {} closed the connection.".format(self.address))
+        magic, count = RESPONSE.unpack(header)
+        if magic == b"ERRS":
+            message = receive(sock, count).decode("utf-8", "replace")
+            raise RuntimeError("Objective function failed on worker {}: {}".format(self.address, message))
+        if magic != b"VALS" or count != len(positions):
+            raise ConnectionError("Invalid response from worker {}.".format(self.address))
+        values = unpack(receive(sock, count * 8))
+        elapsed = max(time.monotonic() - start, 1e-6)
+        rate = count / elapsed
+        self.throughput = rate if self.throughput is None else 0.7 * self.throughput + 0.3 * rate
+        return values
+
+    def dispatch(self, positions, dimension, retry):
+        """
+        Runs a request in an executor thread. The connection is released when the request finishes, even if the
+        evaluation which sent it has already moved on, and closed if the request fails. An objective function error
+        reported by the worker only releases the connection
+        Arguments:
+            positions(list): Positions to evaluate
+            dimension(int): Dimension of the positions
+            retry(float): Delay before reconnecting after a failure in seconds
+        Returns:
+            array: Objective function values
+        """
+        sock = self.sock
+        try:
+            return self.request(positions, dimension)
+        except (OSError, ValueError):
+            self.fail(retry, sock)
+            raise
+        finally:
+            with self.lock:
+                if self.sock is sock:
+                    self.busy = False
+
+    def fail(self, retry, sock=None):
+        """
+        Closes the connection after an error or a timeout, the worker is retried after the delay
+        Arguments:
+            retry(float): Delay before reconnecting in seconds
+            sock(socket): Socket the failure happened on, the connection is left alone if it has been replaced since
+        """
+        with self.lock:
+            if sock is not None and self.sock is not sock:
+                return
+            sock, self.sock = self.sock, None
+            self.busy = False
+            self.retry_at = time.monotonic() + retry
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            sock.close()
+
+
+class DistributedEvaluator(Evaluator):
+
+    def __init__(self, addresses, timeout=30.0, slowness=4.0, retry=5.0):
+        """
+        Spreads the evaluation of the swarm across workers reachable over TCP or Unix sockets. Every batch of
+        positions is split across the live workers proportionally to their measured throughput and shipped as packed
+        float64 arrays over persistent connections. Work of a worker which fails, or takes slowness times longer
+        than its throughput predicts, is re-dispatched to another worker. A slow worker keeps its request and is only
+        disconnected when it does not answer within timeout. When every worker has failed, the evaluation waits for
+        their reconnection for up to timeout. An exception raised by the objective function on a worker is not
+        retried, it is raised from evaluate as a RuntimeError. The workers evaluate their own objective function, the
+        objfunc passed to evaluate is not shipped
+        Arguments:
+            addresses(list): Addresses of the workers, (host, port) tuples or Unix socket paths
+            timeout(float): Connection timeout, request timeout, and the longest wait for a failed worker, in seconds
+            slowness(float): How many times slower than predicted a worker may be before its work is re-dispatched
+            retry(float): Delay before a failed worker is reconnected in seconds
+        """
+        self.connections = [Connection(address, timeout) for address in addresses]
+        self.timeout = timeout
+        self.slowness = slowness
+        self.retry = retry
+        self.executor = ThreadPoolExecutor(max_workers=max(2 * len(self.connections), 1))
+
+    def split(self, count, connections):
+        """
+        Splits count positions into contiguous chunks proportional to the workers' throughput
+        Arguments:
+            count(int): Number of positions
+            connections(list): Live connections
+        Returns:
+            list: (connection, start, end) chunks
+        """
+        known = [c.throughput for c in connections if c.throughput]
+        default = sum(known) / len(known) if known else 1.0
+        weights = [c.throughput or default for c in connections]
+        total = sum(weights)
+        chunks = []
+        start = 0
+        share = 0.0
+        for connection, weight in zip(connections, weights):
+            share += weight
+            end = int(round(count * share / total))
+            if end > start:
+                chunks.append((connection, start, end))
+            start = end
+        return chunks
+
+    def deadline(self, connection, count):
+        """
+        Arguments:
+            connection(Connection): Connection the chunk was sent to
+            count(int): Number of positions in the chunk
+        Returns:
+            float: Number of seconds after which the chunk is re-dispatched
+        """
+        if not connection.throughput:
+            return self.timeout
+        return max(self.slowness * count / connection.throughput, 0.05)
+
+    def reconnect(self, began):
+        """
+        Waits for the earliest retry of the failed workers and reconnects them
+        Arguments:
+            began(float): Monotonic time at which the evaluation started
+        Returns:
+            list: Live connections
+        """
+        while True:
+            now = time.monotonic()
+            live = [c for c in self.connections if c.alive(now, self.retry)]
+            if live:
+                return live
+            retry_at = min(c.retry_at for c in self.connections)
+            if retry_at - began > self.timeout:
+                raise ConnectionError("No evaluation worker could be reconnected.")
+            time.sleep(max(retry_at - now, 0.0))
+
+    def evaluate(self, objfunc, positions):
+        values = [None]*len(positions)
+        if not positions:
+            return values
+        dimension = len(positions[0])
+        began = time.monotonic()
+        live = self.reconnect(began)
+        pending = deque(self.split(len(positions), live))
+        remaining = set(start for _, start, _ in pending)
+        running = {}
+        while remaining:
+            while pending:
+                connection, start, end = pending[0]
+                if start not in remaining:
+                    pending.popleft()
+                    continue
+                if connection is None or connection.busy or connection.sock is None:
+                    now = time.monotonic()
+                    idle = [c for c in self.connections if not c.busy and c.alive(now, self.retry)]
+                    if not idle:
+                        break
+                    connection = max(idle, key=lambda c: c.throughput or 0.0)
+                pending.popleft()
+                connection.busy = True
+                future = self.executor.submit(connection.dispatch, positions[start:end], dimension, self.retry)
+                running[future] = [connection, start, end, time.monotonic(), False]
+            if not running:
+                if not any(c.sock is not None for c in self.connections):
+                    self.reconnect(began)
+                else:
+                    time.sleep(0.01)
+                continue
+            now = time.monotonic()
+            timeout = min(started + (self.timeout if copied else self.deadline(connection, end - start))
+                          for connection, start, end, started, copied in running.values()) - now
+            done, _ = wait(list(running), timeout=max(timeout, 0.0), return_when=FIRST_COMPLETED)
+            for future in done:
+                connection, start, end, _, _ = running.pop(future)
+                try:
+                    chunk = future.result()
+                except (OSError, ValueError):
+                    if start in remaining:
+                        pending.append((None, start, end))
+                    continue
+                if start in remaining:
+                    values[start:end] = chunk
+                    remaining.discard(start)
+            now = time.monotonic()
+            for future, entry in list(running.items()):
+                connection, start, end, started, copied = entry
+                if start not in remaining:
+                    del running[future]
+                elif now - started > max(self.timeout, self.deadline(connection, end - start)):
+                    del running[future]
+                    connection.fail(self.retry)
+                    pending.append((None, start, end))
+                elif not copied and now - started > self.deadline(connection, end - start):
+                    entry[4] = True
+                    pending.append((None, start, end))
+        return values
+
+    def close(self):
+        """
+        Closes the connections to the workers
+        """
+        for connection in self.connections:
+            connection.fail(0.0)
+        self.executor.shutdown(wait=False)
+
+
+def parse_address(text):
+    """
+    Arguments:
+        text(str): host:port or the path of a Unix socket
+    Returns:
+        tuple|str: Worker address
+    """
+    host, _, port = text.rpartition(":")
+    if host and port.isdigit():
+        return host, int(port)
+    return text
+
+
+def main():
+    """
+    Runs a worker, e.g. python -m pso.Distributed pso.Benchmark:ackley 127.0.0.1:5000
+    """
+    parser = argparse.ArgumentParser(description="PSO evaluation worker")
+    parser.add_argument("objective", help="Objective function as module:function")
+    parser.add_argument("address", help="host:port or Unix socket path to listen on")
+    args = parser.parse_args()
+    module, _, name = args.objective.partition(":")
+    objfunc = getattr(importlib.import_module(module), name)
+    worker = Worker(objfunc, parse_address(args.address))
+    print("Serving {} on {}".format(args.objective, worker.address))
+    worker.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,268 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+from array import array
+from struct import Struct
+import os
+import random
+import time
+import weakref
+
+
+class Evaluator(object):
+    """
+    Evaluates the objective function for a whole batch of positions. PSO moves every particle first, hands the
+    positions to the evaluator and feeds the returned values into the usual PB and GB update
+    """
+
+    def evaluate(self, objfunc, positions):
+        """
+        Evaluates the objective function in every position
+        Arguments:
+            objfunc(Function): Objective function
+            positions(list): Positions to evaluate
+        Returns:
+            list: Objective function values in the same order as the positions
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Releases the resources held by the evaluator
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def evaluate_batch(objfunc, positions):
+    """
+    Evaluates the objective function in every position, using the objective's batch form if it has one
+    Arguments:
+        objfunc(Function): Objective function, optionally with a batch attribute which evaluates a list of positions
+        positions(list): Positions to evaluate
+    Returns:
+        list: Objective function values
+    """
+    batch = getattr(objfunc, "batch", None)
+    if batch:
+        return list(batch(positions))
+    return [objfunc(position) for position in positions]
+
+
+class SerialEvaluator(Evaluator):
+
+    def evaluate(self, objfunc, positions):
+        return evaluate_batch(objfunc, positions)
+
+
+class ThreadEvaluator(Evaluator):
+
+    def __init__(self, threads=None, chunks=2):
+        """
+        Evaluates the swarm in chunks on a persistent thread pool. Useful for objective functions which release the
+        GIL, e.g. NumPy or SciPy heavy ones, where a process pool only adds startup and pickling overhead. The threads
+        only compute values, PB and GB are updated by the optimizer once the batch is done
+        Arguments:
+            threads(int): Number of threads, if None the number of CPUs is used
+            chunks(int): Number of chunks per thread and batch
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        self.threads = threads or os.cpu_count() or 1
+        self.chunks = chunks
+        self.executor = ThreadPoolExecutor(max_workers=self.threads)
+
+    def evaluate(self, objfunc, positions):
+        n = len(positions)
+        parts = min(self.threads * self.chunks, n)
+        if parts <= 1:
+            return evaluate_batch(objfunc, positions)
+        bounds = [n * k // parts for k in range(parts + 1)]
+        futures = [self.executor.submit(evaluate_batch, objfunc, positions[bounds[k]:bounds[k + 1]])
+                   for k in range(parts)]
+        values = []
+        for future in futures:
+            values.extend(future.result())
+        return values
+
+    def close(self):
+        """
+        Shuts the thread pool down
+        """
+        self.executor.shutdown()
+
+
+shared = {}
+
+
+def attach(name, capacity, dimension, objfunc):
+    """
+    Initializer of the worker processes, attaches to the shared swarm buffers
+    Arguments:
+        name(str): Name of the shared memory segment
+        capacity(int): Maximal number of positions in the segment
+        dimension(int): Dimension of the problem
+        objfunc(Function): Objective function
+    """
+    from multiprocessing import shared_memory
+    segment = shared_memory.SharedMemory(name=name)
+    view = segment.buf.cast("d")
+    shared["segment"] = segment
+    shared["positions"] = view[:capacity * dimension]
+    shared["values"] = view[capacity * dimension:capacity * (dimension + 1)]
+    shared["dimension"] = dimension
+    shared["objfunc"] = objfunc
+
+
+def evaluate_range(bounds):
+    """
+    Evaluates the positions with indices in [start, end) in place in the shared buffers
+    Arguments:
+        bounds(tuple): Start and end index
+    """
+    start, end = bounds
+    d = shared["dimension"]
+    flat = shared["positions"][start * d:end * d].tolist()
+    positions = [flat[i:i + d] for i in range(0, len(flat), d)]
+    shared["values"][start:end] = array("d", evaluate_batch(shared["objfunc"], positions))
+
+
+def release(pool, segment, views):
+    """
+    Stops the worker processes and frees the shared memory segment
+    Arguments:
+        pool(Pool): Worker processes
+        segment(SharedMemory): Shared memory segment
+        views(list): Memory views of the segment which have to be released before it is closed
+    """
+    pool.terminate()
+    pool.join()
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+    for view in views:
+        view.release()
+    segment.close()
+
+
+class SharedMemoryEvaluator(Evaluator):
+
+    def __init__(self, objfunc, capacity, dimension, processes=None, chunks=4, timeout=None):
+        """
+        Evaluates the swarm in a process pool without pickling positions or values. The positions and the values of
+        the swarm live in a multiprocessing.shared_memory segment, the workers read their slice of the positions and
+        write the values in place, so only index ranges cross the process boundary. The segment is unlinked by
+        close, when the evaluator is garbage collected or at interpreter exit, and by the resource tracker if the
+        process crashes. The workers evaluate the objective function given here, which must be picklable, and
+        evaluate raises ValueError for any other function
+        Arguments:
+            objfunc(Function): Objective function
+            capacity(int): Maximal number of positions per batch, usually the number of particles
+            dimension(int): Dimension of the problem
+            processes(int): Number of worker processes, if None the number of CPUs is used
+            chunks(int): Number of index ranges per worker process and batch
+            timeout(float): Seconds to wait for a batch before raising TimeoutError, None waits forever
+        """
+        from multiprocessing import Pool, shared_memory
+        self.objfunc = objfunc
+        self.capacity = capacity
+        self.dimension = dimension
+        self.timeout = timeout
+        self.segment = shared_memory.SharedMemory(create=True, size=max(capacity * (dimension + 1) * 8, 8))
+        view = self.segment.buf.cast("d")
+        self.positions = view[:capacity * dimension]
+        self.values = view[capacity * dimension:capacity * (dimension + 1)]
+        self.row = Struct("{}d".format(dimension))
+        self.processes = processes or os.cpu_count() or 1
+        self.pool = Pool(processes, initializer=attach, initargs=(self.segment.name, capacity, dimension, objfunc))
+        self.chunks = chunks
+        self.finalizer = weakref.finalize(self, release, self.pool, self.segment, [self.positions, self.values, view])
+
+    def evaluate(self, objfunc, positions):
+        if objfunc is not self.objfunc:
+            raise ValueError("Objective function {!r} differs from the function {!r} the worker processes were "
+                             "started with.".format(objfunc, self.objfunc))
+        n = len(positions)
+        if n > self.capacity:
+            raise ValueError("Batch of {} positions exceeds the shared buffer capacity {}.".format(n, self.capacity))
+        pack_into = self.row.pack_into
+        buffer = self.segment.buf
+        stride = self.row.size
+        for i, position in enumerate(positions):
+            pack_into(buffer, i * stride, *position)
+        parts = min(self.processes * self.chunks, n)
+        bounds = [(n * k // parts, n * (k + 1) // parts) for k in range(parts)]
+        self.pool.map_async(evaluate_range, bounds).get(self.timeout)
+        return self.values[:n].tolist()
+
+    def close(self):
+        """
+        Stops the worker processes and frees the shared memory segment
+        """
+        self.finalizer()
+
+
+def recommend_evaluator(objfunc, dimension, npart=30, workers=None, repeat=3, span=1.0):
+    """
+    Times serial, thread and shared-memory process evaluation of random batches of the objective function and
+    recommends the fastest one. Setup costs (starting the pool) are measured separately and excluded from the batch
+    times, since the pools are persistent. The process pool is skipped if the objective function cannot be pickled
+    Arguments:
+        objfunc(Function): Objective function
+        dimension(int): Dimension of the problem
+        npart(int): Number of positions per batch
+        workers(int): Number of threads and processes, if None the number of CPUs is used
+        repeat(int): Number of timed batches, the best time is taken
+        span(float): Positions are drawn uniformly from [-span, span]
+    Returns:
+        tuple: Name of the fastest mode ("serial", "thread" or "process") and a dictionary of the best batch time and
+               the setup time of every measured mode in seconds
+    """
+    positions = [[random.uniform(-span, span) for _ in range(dimension)] for _ in range(npart)]
+    timings = {}
+    factories = [
+        ("serial", lambda: SerialEvaluator()),
+        ("thread", lambda: ThreadEvaluator(workers)),
+        ("process", lambda: SharedMemoryEvaluator(objfunc, npart, dimension, workers))
+    ]
+    for name, factory in factories:
+        start = time.perf_counter()
+        try:
+            evaluator = factory()
+        except Exception:
+            continue
+        setup = time.perf_counter() - start
+        try:
+            best = None
+            for _ in range(repeat + 1):
+                start = time.perf_counter()
+                evaluator.evaluate(objfunc, positions)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = {"batch": best, "setup": setup}
+        except Exception:
+            pass
+        finally:
+            evaluator.close()
+    return min(timings, key=lambda name: timings[name]["batch"]), timings
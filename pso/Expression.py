@@ -0,0 +1,203 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from functools import lru_cache
+import ast
+import math
+
+elementwise = {
+    "sin": math.sin, "cos": math.cos, "tan": math.tan,
+    "asin": math.asin, "acos": math.acos, "atan": math.atan,
+    "sinh": math.sinh, "cosh": math.cosh, "tanh": math.tanh,
+    "exp": math.exp, "log": math.log, "log10": math.log10, "sqrt": math.sqrt,
+    "abs": abs, "floor": math.floor, "ceil": math.ceil
+}
+
+reductions = {
+    "sum": sum,
+    "prod": math.prod,
+    "min": min,
+    "max": max,
+    "mean": None
+}
+
+constants = {
+    "pi": math.pi,
+    "e": math.e
+}
+
+operators = {
+    ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/", ast.Pow: "**", ast.Mod: "%"
+}
+
+
+class Expression(object):
+
+    def __init__(self, text, source, function):
+        """
+        Objective function compiled from an expression. Calling it evaluates one position, batch evaluates a list
+        of positions
+        Arguments:
+            text(str): Expression text
+            source(str): Generated Python source
+            function(Function): Compiled function of one position
+        """
+        self.text = text
+        self.source = source
+        self.function = function
+        self.__name__ = text
+
+    def __call__(self, x):
+        return self.function(x)
+
+    def batch(self, positions):
+        """
+        Evaluates the expression for every position
+        Arguments:
+            positions(list): Positions
+        Returns:
+            list: Values of the expression
+        """
+        function = self.function
+        return [function(x) for x in positions]
+
+
+class Compiler(object):
+
+    def __init__(self):
+        """
+        Translates an expression over the position vector x into a Python function. Vector subexpressions are
+        evaluated element by element inside a single generator per reduction, and every reduction is computed once
+        into a temporary before it is used, so the generated code does exactly the work a hand-written objective does
+        """
+        self.statements = []
+        self.uses_index = False
+
+    def compile(self, text):
+        """
+        Arguments:
+            text(str): Expression text
+        Returns:
+            str: Python source of the function _objective(x)
+        """
+        try:
+            tree = ast.parse(text.strip(), mode="eval")
+        except SyntaxError as error:
+            raise ValueError("Invalid expression: {}".format(error.msg))
+        kind, code = self.visit(tree.body)
+        if kind != "scalar":
+            raise ValueError("Expression must reduce the vector x to a scalar, e.g. sum(x**2).")
+        lines = ["def _objective(x):", "    d = len(x)"]
+        if self.uses_index:
+            lines.append("    _index = range(1, d + 1)")
+        lines.extend("    " + statement for statement in self.statements)
+        lines.append("    return " + code)
+        return "\n".join(lines)
+
+    def visit(self, node):
+        """
+        Arguments:
+            node(ast.AST): Expression node
+        Returns:
+            tuple: Kind of the node ("scalar" or "vector") and its code, vector code refers to the current element
+        """
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise ValueError("Only numeric constants are allowed.")
+            return "scalar", repr(float(node.value))
+        if isinstance(node, ast.Name):
+            if node.id == "x":
+                return "vector", "_x"
+            if node.id == "i":
+                self.uses_index = True
+                return "vector", "_i"
+            if node.id == "d":
+                return "scalar", "d"
+            if node.id in constants:
+                return "scalar", repr(constants[node.id])
+            raise ValueError("Unknown name '{}'. Use x, i, d, pi or e.".format(node.id))
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            kind, code = self.visit(node.operand)
+            return kind, "({}{})".format("-" if isinstance(node.op, ast.USub) else "+", code)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow) and isinstance(node.right, ast.Constant) \
+                and node.right.value == 2 and not isinstance(node.right.value, bool):
+            kind, code = self.visit(node.left)
+            if code.isidentifier():
+                return kind, "({} * {})".format(code, code)
+        if isinstance(node, ast.BinOp) and type(node.op) in operators:
+            left_kind, left = self.visit(node.left)
+            right_kind, right = self.visit(node.right)
+            kind = "vector" if "vector" in (left_kind, right_kind) else "scalar"
+            return kind, "({} {} {})".format(left, operators[type(node.op)], right)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and not node.keywords \
+                and len(node.args) == 1:
+            name = node.func.id
+            if name in elementwise:
+                kind, code = self.visit(node.args[0])
+                return kind, "_{}({})".format(name, code)
+            if name in reductions:
+                return "scalar", self.reduce(name, node.args[0])
+        raise ValueError("Unsupported construct in expression: {}.".format(ast.dump(node)[:60]))
+
+    def reduce(self, name, argument):
+        """
+        Emits the temporary which holds the reduction of a vector subexpression
+        Arguments:
+            name(str): Name of the reduction
+            argument(ast.AST): Vector subexpression
+        Returns:
+            str: Name of the temporary
+        """
+        kind, code = self.visit(argument)
+        if kind != "vector":
+            raise ValueError("{}() expects a vector expression of x or i.".format(name))
+        if "_i" in code and "_x" in code:
+            loop = "for _x, _i in zip(x, _index)"
+        elif "_i" in code:
+            loop = "for _i in _index"
+        else:
+            loop = "for _x in x"
+        temp = "_t{}".format(len(self.statements))
+        if name == "mean":
+            self.statements.append("{} = _sum([{} {}]) / d".format(temp, code, loop))
+        else:
+            self.statements.append("{} = _{}([{} {}])".format(temp, name, code, loop))
+        return temp
+
+
+@lru_cache(maxsize=128)
+def compile_expression(text):
+    """
+    Safely compiles an objective function expression such as "sum(x**2) + prod(cos(x))". The expression may use the
+    position vector x, the 1-based index vector i, the dimension d, the constants pi and e, arithmetic operators, the
+    elementwise functions sin, cos, tan, asin, acos, atan, sinh, cosh, tanh, exp, log, log10, sqrt, abs, floor, ceil
+    and the reductions sum, prod, min, max, mean. Only whitelisted syntax is accepted, so the expression cannot
+    reach any other Python object. Compiled expressions are cached by their text
+    Arguments:
+        text(str): Expression text
+    Returns:
+        Expression: Compiled objective function
+    """
+    source = Compiler().compile(text)
+    namespace = {"__builtins__": {}, "len": len, "range": range, "zip": zip}
+    namespace.update({"_" + name: function for name, function in elementwise.items()})
+    namespace.update({"_" + name: function for name, function in reductions.items() if function})
+    exec(compile(source, "<expression>", "exec"), namespace)
+    return Expression(text, source, namespace["_objective"])
@@ -0,0 +1,330 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from functools import lru_cache
+from math import sin, cos, pi, sqrt
+from pso.Benchmark import ackley, griewank, michalewicz
+import random
+
+
+def rastrigin(x):
+    """
+    Rastrigin function
+    Arguments:
+        x(list): Position
+    Returns:
+        float: Function evaluation at the given position
+    """
+    s = 10 * len(x)
+    for xi in x:
+        s += xi * xi - 10 * cos(2 * pi * xi)
+    return s
+
+
+def rosenbrock(x):
+    """
+    Rosenbrock function
+    Arguments:
+        x(list): Position
+    Returns:
+        float: Function evaluation at the given position
+    """
+    s = 0
+    for i in range(len(x) - 1):
+        s += 100 * (x[i + 1] - x[i] * x[i]) ** 2 + (1 - x[i]) ** 2
+    return s
+
+
+def schwefel(x):
+    """
+    Schwefel function
+    Arguments:
+        x(list): Position
+    Returns:
+        float: Function evaluation at the given position
+    """
+    s = 418.9828872724338 * len(x)
+    for xi in x:
+        s -= xi * sin(sqrt(abs(xi)))
+    return s
+
+
+def levy(x):
+    """
+    Levy function
+    Arguments:
+        x(list): Position
+    Returns:
+        float: Function evaluation at the given position
+    """
+    w = [1 + (xi - 1) / 4 for xi in x]
+    s = sin(pi * w[0]) ** 2
+    for i in range(len(w) - 1):
+        s += (w[i] - 1) ** 2 * (1 + 10 * sin(pi * w[i] + 1) ** 2)
+    return s + (w[-1] - 1) ** 2 * (1 + sin(2 * pi * w[-1]) ** 2)
+
+
+def zakharov(x):
+    """
+    Zakharov function
+    Arguments:
+        x(list): Position
+    Returns:
+        float: Function evaluation at the given position
+    """
+    s1 = 0
+    s2 = 0
+    for i in range(len(x)):
+        s1 += x[i] * x[i]
+        s2 += 0.5 * (i + 1) * x[i]
+    return s1 + s2 ** 2 + s2 ** 4
+
+
+def styblinski_tang(x):
+    """
+    Styblinski-Tang function
+    Arguments:
+        x(list): Position
+    Returns:
+        float: Function evaluation at the given position
+    """
+    s = 0
+    for xi in x:
+        x2 = xi * xi
+        s += x2 * x2 - 16 * x2 + 5 * xi
+    return s / 2
+
+
+class BenchmarkFunction(object):
+
+    def __init__(self, name, function, bounds, optimum, optimum_position=None, bounded=False):
+        """
+        Benchmark function together with its search bounds and known optimum
+        Arguments:
+            name(str): Name of the function
+            function(Function): Objective function of one position
+            bounds(tuple): Lower and upper bound of every coordinate
+            optimum(Function): Returns the optimal value for a dimension, or None if it is not known
+            optimum_position(Function): Returns the optimal position for a dimension, or None if it is not known
+            bounded(bool): Whether the function is only meaningful inside its bounds, outside of them it is then
+                           evaluated at the nearest point of the bounds plus the squared distance to it
+        """
+        self.name = name
+        self.__name__ = name
+        self.function = penalize(function, bounds) if bounded else function
+        self.bounds = bounds
+        self.optimum = optimum
+        self.optimum_position = optimum_position if optimum_position else lambda d: None
+
+    def __call__(self, x):
+        return self.function(x)
+
+    def batch(self, positions):
+        """
+        Evaluates the function for every position
+        Arguments:
+            positions(list): Positions
+        Returns:
+            list: Function values
+        """
+        function = self.function
+        return [function(x) for x in positions]
+
+    def error(self, value, dimension):
+        """
+        Arguments:
+            value(float): Objective function value
+            dimension(int): Dimension of the problem
+        Returns:
+            float: Distance of the value to the known optimum, None if the optimum is not known
+        """
+        optimum = self.optimum(dimension)
+        return None if optimum is None else value - optimum
+
+    def configure(self, options):
+        """
+        Sets the initial population of the options to the function's bounds
+        Arguments:
+            options(PSO.Options): Algorithm options
+        """
+        low, high = self.bounds
+        options.initoffset = (low + high) / 2
+        options.initspan = (high - low) / 2
+
+
+def penalize(function, bounds):
+    """
+    Arguments:
+        function(Function): Objective function of one position
+        bounds(tuple): Lower and upper bound of every coordinate
+    Returns:
+        Function: Objective function which evaluates positions outside of the bounds at the nearest point of the
+                  bounds and adds the squared distance to it
+    """
+    low, high = bounds
+
+    def bounded(x):
+        penalty = 0
+        for xi in x:
+            if xi < low:
+                penalty += (low - xi) ** 2
+            elif xi > high:
+                penalty += (xi - high) ** 2
+        if not penalty:
+            return function(x)
+        return function([min(max(xi, low), high) for xi in x]) + penalty
+    return bounded
+
+
+class TransformedFunction(BenchmarkFunction):
+
+    def __init__(self, base, dimension, seed):
+        """
+        CEC-style shifted and rotated variant of a benchmark function, f(R(x - o) + x*), where R is a random rotation,
+        o a random shift inside the bounds and x* the optimum of the base function. The optimum moves to o and keeps
+        its value. The transform is generated once per (function, dimension, seed)
+        Arguments:
+            base(BenchmarkFunction): Base function, its optimal position must be known
+            dimension(int): Dimension of the problem
+            seed(int): Seed of the transform
+        """
+        center = base.optimum_position(dimension)
+        if center is None:
+            raise ValueError("Optimal position of {} is not known, it can not be shifted.".format(base.name))
+        rotation, shift = transform(base.name, base.bounds, dimension, seed)
+        self.rotation = rotation
+        self.shift = shift
+        self.center = center
+        self.base = base
+        name = "{}-shifted-rotated".format(base.name)
+        super(TransformedFunction, self).__init__(name, self.evaluate, base.bounds, base.optimum,
+                                                  lambda d: list(shift) if d == dimension else None)
+
+    def evaluate(self, x):
+        """
+        Arguments:
+            x(list): Position
+        Returns:
+            float: Function evaluation at the given position
+        """
+        diff = [xi - oi for xi, oi in zip(x, self.shift)]
+        z = [sum([r * y for r, y in zip(row, diff)]) + c for row, c in zip(self.rotation, self.center)]
+        return self.base.function(z)
+
+    def batch(self, positions):
+        rotation = list(zip(self.rotation, self.center))
+        shift = self.shift
+        function = self.base.function
+        values = []
+        for x in positions:
+            diff = [xi - oi for xi, oi in zip(x, shift)]
+            values.append(function([sum([r * y for r, y in zip(row, diff)]) + c for row, c in rotation]))
+        return values
+
+
+@lru_cache(maxsize=None)
+def transform(name, bounds, dimension, seed):
+    """
+    Generates the random rotation matrix and shift vector of a function, cached per (function, dimension, seed)
+    Arguments:
+        name(str): Name of the function
+        bounds(tuple): Lower and upper bound of every coordinate
+        dimension(int): Dimension of the problem
+        seed(int): Seed of the transform
+    Returns:
+        tuple: Rotation matrix as a tuple of rows and the shift vector
+    """
+    generator = random.Random("{}/{}/{}".format(name, dimension, seed))
+    rows = []
+    while len(rows) < dimension:
+        v = [generator.gauss(0, 1) for _ in range(dimension)]
+        for row in rows:
+            dot = sum(a * b for a, b in zip(v, row))
+            v = [a - dot * b for a, b in zip(v, row)]
+        norm = sqrt(sum(a * a for a in v))
+        if norm > 1e-8:
+            rows.append(tuple(a / norm for a in v))
+    low, high = bounds
+    margin = 0.2 * (high - low) / 2
+    shift = tuple(generator.uniform(low + margin, high - margin) for _ in range(dimension))
+    return tuple(rows), shift
+
+
+michalewicz_optima = {2: -1.8013034100985537, 5: -4.687658179, 10: -9.66015171564}
+
+functions = {}
+
+
+def register(function):
+    """
+    Adds a benchmark function to the registry
+    Arguments:
+        function(BenchmarkFunction): Benchmark function
+    Returns:
+        BenchmarkFunction: The registered function
+    """
+    functions[function.name] = function
+    return function
+
+
+def get(name, dimension=None, seed=None):
+    """
+    Looks a benchmark function up
+    Arguments:
+        name(str): Name of the function
+        dimension(int): Dimension of the problem, required for the shifted and rotated variant
+        seed(int): Seed of the shifted and rotated variant, None returns the plain function
+    Returns:
+        BenchmarkFunction: Benchmark function
+    """
+    try:
+        function = functions[name]
+    except KeyError:
+        raise ValueError("Unknown benchmark function '{}'. Available functions: {}.".format(
+            name, ", ".join(sorted(functions))))
+    if seed is None:
+        return function
+    return shifted_rotated(name, dimension, seed)
+
+
+@lru_cache(maxsize=256)
+def shifted_rotated(name, dimension, seed=0):
+    """
+    Arguments:
+        name(str): Name of the registered base function
+        dimension(int): Dimension of the problem
+        seed(int): Seed of the transform
+    Returns:
+        TransformedFunction: Shifted and rotated variant, cached per (function, dimension, seed)
+    """
+    return TransformedFunction(get(name), dimension, seed)
+
+
+register(BenchmarkFunction("ackley", ackley, (-32.768, 32.768), lambda d: 0.0, lambda d: [0.0]*d))
+register(BenchmarkFunction("griewank", griewank, (-600.0, 600.0), lambda d: 0.0, lambda d: [0.0]*d))
+register(BenchmarkFunction("michalewicz", michalewicz, (0.0, pi), michalewicz_optima.get))
+register(BenchmarkFunction("rastrigin", rastrigin, (-5.12, 5.12), lambda d: 0.0, lambda d: [0.0]*d))
+register(BenchmarkFunction("rosenbrock", rosenbrock, (-5.0, 10.0), lambda d: 0.0, lambda d: [1.0]*d))
+register(BenchmarkFunction("schwefel", schwefel, (-500.0, 500.0), lambda d: 0.0, lambda d: [420.9687462275036]*d,
+                           bounded=True))
+register(BenchmarkFunction("levy", levy, (-10.0, 10.0), lambda d: 0.0, lambda d: [1.0]*d))
+register(BenchmarkFunction("zakharov", zakharov, (-5.0, 10.0), lambda d: 0.0, lambda d: [0.0]*d))
+register(BenchmarkFunction("styblinski-tang", styblinski_tang, (-5.0, 5.0), lambda d: -39.16616570377142 * d,
+                           lambda d: [-2.903534027771177]*d))
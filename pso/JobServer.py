@@ -0,0 +1,231 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from heapq import heappop, heappush
+from itertools import count
+from math import inf
+import threading
+import time
+from pso.PSO import PSO
+from pso.LeanPSO import Swarm
+from pso.Schedule import create_schedule
+from pso.Evaluator import evaluate_batch
+
+
+class Job(object):
+
+    def __init__(self, objfunc, dimension, options, priority, deadline, future):
+        """
+        Optimization request waiting in or running on a JobServer
+        Arguments:
+            objfunc(Function): Objective function
+            dimension(int): Dimension of the problem
+            options(PSO.Options): Algorithm options, only static schedules are supported
+            priority(int): Jobs with a higher priority are started first
+            deadline(float): Time (time.perf_counter) at which the job returns its best-so-far result
+            future(Future): Future which receives the PSO.Result
+        """
+        self.objfunc = objfunc
+        self.dimension = dimension
+        self.options = options
+        self.priority = priority
+        self.deadline = deadline
+        self.future = future
+        self.key = (objfunc, dimension)
+        self.schedule = create_schedule(options)
+        if self.schedule.needs_diversity or self.schedule.per_particle:
+            raise ValueError("Unsupported schedule '{}'. The job server supports only static schedules.".format(
+                options.schedule))
+        self.swarm = None
+        self.started = False
+        self.iteration = 0
+        self.history = []
+
+    def result(self, expired):
+        """
+        Arguments:
+            expired(bool): Whether the deadline ended the job
+        Returns:
+            PSO.Result: Result of the job with the evaluations, iterations and expired attributes set
+        """
+        swarm = self.swarm
+        base = swarm.best * self.dimension
+        result = PSO.Result(swarm.best_values[swarm.best], swarm.best_positions[base:base + self.dimension].tolist(),
+                            self.history)
+        result.evaluations = swarm.npart * (self.iteration + 1)
+        result.iterations = self.iteration
+        result.expired = expired
+        return result
+
+
+class JobServer(object):
+
+    def __init__(self, workers=1, batch=1024, evaluator=None):
+        """
+        Long-lived server for many small independent optimizations. Submitted jobs wait in a queue ordered by priority
+        and deadline. A worker admits jobs from the head of the queue while their particles fit in its batch and steps
+        all their swarms in lock-step, evaluating the particles of the jobs with the same objective function and
+        dimension as one batch. Whenever running jobs finish, the worker admits the next queued jobs in queue order, so
+        a job is never overtaken by a lower ranked one, and each job's future is resolved as soon as the job finishes,
+        so results stream back independently of the rest of the batch
+        Arguments:
+            workers(int): Number of worker threads
+            batch(int): Maximal number of particles a worker evaluates in one batch
+            evaluator(Evaluator): Evaluator of the batches, it must accept every submitted objective function. If None
+                                  the objective's batch form is called in the worker
+        """
+        self.batch = batch
+        self.evaluator = evaluator
+        self.queue = []
+        self.order = count()
+        self.condition = threading.Condition()
+        self.closed = False
+        self.workers = [threading.Thread(target=self.work, daemon=True) for _ in range(workers)]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, objfunc, dimension, options=None, priority=0, deadline=None):
+        """
+        Queues an optimization
+        Arguments:
+            objfunc(Function): Objective function
+            dimension(int): Dimension of the problem
+            options(PSO.Options): Algorithm options, if None default options will be used
+            priority(int): Jobs with a higher priority are started first
+            deadline(float): Seconds from now after which the job returns its best-so-far result, None for no deadline.
+                             A job whose deadline passes while it is queued returns the best of its initial swarm
+        Returns:
+            Future: Future of the PSO.Result, its expired attribute tells whether the deadline ended the job
+        """
+        from concurrent.futures import Future
+        end = time.perf_counter() + deadline if deadline is not None else inf
+        job = Job(objfunc, dimension, options if options else PSO.Options(), priority, end, Future())
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("Cannot submit a job to a closed job server.")
+            heappush(self.queue, (-priority, end, next(self.order), job))
+            self.condition.notify()
+        return job.future
+
+    def take(self, room):
+        """
+        Removes jobs from the head of the queue until the particles of the next one do not fit in the room.
+        The caller must hold the condition
+        Arguments:
+            room(int): Number of particles which can still be added to the batch
+        Returns:
+            list: Removed jobs
+        """
+        taken = []
+        queue = self.queue
+        while queue and queue[0][3].options.npart <= room:
+            job = heappop(queue)[3]
+            taken.append(job)
+            room -= job.options.npart
+        return taken
+
+    def work(self):
+        """
+        Worker loop, runs batches of jobs until the server is closed and the queue is empty
+        """
+        while True:
+            with self.condition:
+                while not self.queue and not self.closed:
+                    self.condition.wait()
+                if not self.queue:
+                    return
+                job = heappop(self.queue)[3]
+                jobs = [job] + self.take(self.batch - job.options.npart)
+            try:
+                self.run(jobs)
+            except Exception as error:
+                for job in jobs:
+                    if not job.future.done():
+                        job.future.set_exception(error)
+
+    def run(self, jobs):
+        """
+        Steps the swarms of the jobs in lock-step until all of them are finished
+        Arguments:
+            jobs(list): Jobs to run, the list is extended with the jobs which join the batch
+        """
+        running = []
+        pending = list(jobs)
+        while pending or running:
+            for job in pending:
+                if not job.future.set_running_or_notify_cancel():
+                    continue
+                job.swarm = Swarm(job.options.npart, job.dimension)
+                job.swarm.draw(job.options)
+                running.append(job)
+            if not running:
+                break
+            groups = {}
+            for job in running:
+                if job.started:
+                    w, cp, cg = job.schedule.coefficients(job.iteration + 1)
+                    job.swarm.move(w, cp, cg, job.options.vmax)
+                groups.setdefault(job.key, []).append(job)
+            for (objfunc, _), group in groups.items():
+                positions = [position for job in group for position in job.swarm.rows]
+                if self.evaluator:
+                    values = self.evaluator.evaluate(objfunc, positions)
+                else:
+                    values = evaluate_batch(objfunc, positions)
+                start = 0
+                for job in group:
+                    job.swarm.assign(values, start)
+                    start += job.swarm.npart
+            now = time.perf_counter()
+            active = []
+            for job in running:
+                swarm = job.swarm
+                if job.started:
+                    job.iteration += 1
+                    job.history.append(swarm.best_values[swarm.best])
+                job.started = True
+                expired = now >= job.deadline
+                if job.iteration >= job.options.niter or expired:
+                    job.future.set_result(job.result(expired and job.iteration < job.options.niter))
+                else:
+                    active.append(job)
+            running = active
+            with self.condition:
+                pending = self.take(self.batch - sum(job.options.npart for job in running))
+            jobs.extend(pending)
+
+    def close(self, wait=True):
+        """
+        Stops accepting jobs, the workers finish the queued ones and exit
+        Arguments:
+            wait(bool): Whether to wait for the workers to exit
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        if wait:
+            for worker in self.workers:
+                worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
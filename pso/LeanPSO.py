@@ -0,0 +1,229 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from array import array
+from math import inf
+import random
+from pso.PSO import PSO
+from pso.Schedule import create_schedule
+
+
+class Swarm(object):
+    __slots__ = ("npart", "dimension", "positions", "velocities", "values", "best_positions", "best_values", "best",
+                 "rows", "best_rows")
+
+    def __init__(self, npart, dimension):
+        """
+        Swarm stored in flat buffers, the coordinates of the particle i occupy [i*dimension, (i+1)*dimension)
+        Arguments:
+            npart(int): Number of particles
+            dimension(int): Dimension of the problem
+        """
+        self.npart = npart
+        self.dimension = dimension
+        self.positions = array("d", bytes(8 * npart * dimension))
+        self.velocities = array("d", bytes(8 * npart * dimension))
+        self.values = array("d", [inf]) * npart
+        self.best_positions = array("d", bytes(8 * npart * dimension))
+        self.best_values = array("d", [inf]) * npart
+        self.best = 0
+        view = memoryview(self.positions)
+        self.rows = [view[i * dimension:(i + 1) * dimension] for i in range(npart)]
+        view = memoryview(self.best_positions)
+        self.best_rows = [view[i * dimension:(i + 1) * dimension] for i in range(npart)]
+
+    def draw(self, options):
+        """
+        Draws the positions and the velocities the same way PSO.init_population does, without evaluating them
+        Arguments:
+            options(PSO.Options): Algorithm options
+        """
+        uniform = random.uniform
+        d = self.dimension
+        positions = self.positions
+        velocities = self.velocities
+        for i in range(self.npart):
+            base = i * d
+            for k in range(base, base + d):
+                velocities[k] = uniform(-options.vspan, options.vspan)
+                positions[k] = uniform(-options.initspan, options.initspan) + options.initoffset
+
+    def initialize(self, objfunc, options):
+        """
+        Draws the particles, evaluates them and finds GB
+        Arguments:
+            objfunc(Function): Objective function
+            options(PSO.Options): Algorithm options
+        """
+        self.draw(options)
+        self.evaluate(objfunc)
+        self.assign(self.values)
+
+    def move(self, w, cp, cg, vmax):
+        """
+        Updates the velocities and the positions of all particles without evaluating the objective function
+        Arguments:
+            w(float): Inertia coefficient
+            cp(float): Cognitive coefficient
+            cg(float): Social coefficient
+            vmax(float): Maximal velocity that a particle can have
+        """
+        rand = random.random
+        positions = self.positions
+        velocities = self.velocities
+        best_positions = self.best_positions
+        clamp = vmax < inf
+        d = self.dimension
+        shift = self.best * d
+        for k in range(len(positions)):
+            x = positions[k]
+            v = w * velocities[k] + rand() * cp * (best_positions[k] - x) + rand() * cg * (
+                    best_positions[shift + k % d] - x)
+            if clamp:
+                if v > vmax:
+                    v = vmax
+                elif v < -vmax:
+                    v = -vmax
+            velocities[k] = v
+            positions[k] = x + v
+
+    def evaluate(self, objfunc):
+        """
+        Evaluates every particle, writing the values straight into the values buffer
+        Arguments:
+            objfunc(Function): Objective function
+        """
+        values = self.values
+        rows = self.rows
+        for i in range(self.npart):
+            values[i] = objfunc(rows[i])
+
+    def assign(self, values, start=0):
+        """
+        Stores the objective function values of the positions, which may have been evaluated elsewhere, updates PB in
+        place and selects GB once for the whole swarm from the particles whose PB improved. The values are read in one
+        pass, no intermediate container is built
+        Arguments:
+            values(list): Objective function values, the value of the particle i is values[start + i]. It may be the
+                          swarm's own values buffer
+            start(int): Offset of the swarm's values in values
+        Returns:
+            int: Number of particles whose PB improved
+        """
+        rows = self.rows
+        best_rows = self.best_rows
+        best_values = self.best_values
+        current = self.values
+        improved = 0
+        candidate = -1
+        for i in range(self.npart):
+            value = values[start + i]
+            current[i] = value
+            if value < best_values[i]:
+                best_values[i] = value
+                best_rows[i][:] = rows[i]
+                improved += 1
+                if candidate < 0 or value < best_values[candidate]:
+                    candidate = i
+        if improved and best_values[candidate] < best_values[self.best]:
+            self.best = candidate
+        return improved
+
+    def step(self, w, cp, cg, vmax, objfunc):
+        """
+        Moves and evaluates every particle once, then updates PB in place and selects GB once for the whole swarm
+        Arguments:
+            w(float): Inertia coefficient
+            cp(float): Cognitive coefficient
+            cg(float): Social coefficient
+            vmax(float): Maximal velocity that a particle can have
+            objfunc(Function): Objective function
+        Returns:
+            int: Number of particles whose PB improved
+        """
+        self.move(w, cp, cg, vmax)
+        self.evaluate(objfunc)
+        return self.assign(self.values)
+
+
+class LeanPSO(object):
+
+    def __init__(self, objfunc, dimension, opts=None):
+        """
+        Allocation-free pure Python engine for deployments without NumPy. It runs the same algorithm as PSO with a
+        static coefficient schedule, but keeps the swarm in flat array('d') buffers with persistent row views instead
+        of Particle objects, so an iteration creates no list, array or memoryview. The objective function receives a memoryview of the particle's coordinates,
+        which it must not keep. Restarts, local search, recording and evaluators are not supported
+        Arguments:
+            objfunc(Function): Objective function
+            dimension(int): Dimension of the problem, the number of the variables
+            opts(PSO.Options): Algorithm options, if None default options will be used
+        """
+        self.options = opts if opts else PSO.Options()
+        self.schedule = create_schedule(self.options)
+        if self.schedule.needs_diversity or self.schedule.per_particle:
+            raise ValueError("Unsupported schedule '{}'. The lean engine supports only static schedules.".format(
+                self.options.schedule))
+        self.swarm = None
+        self.global_best = inf
+        self.evaluations = 0
+        self.local_evaluations = 0
+        self.dimension = dimension
+        self.objfunc = objfunc
+
+    def optimize(self, logfunc=None, observer=None):
+        """
+        Optimizes the objective function
+        Arguments:
+            logfunc(Function): Function which is called every 10 iterations
+            observer(Function): Function which is called after every iteration with the iteration and the algorithm,
+                                whose global_best and evaluations attributes are then up to date
+        Returns:
+            PSO.Result with the global best evaluation, the global best position and the history of the global best
+            evaluations, whose evaluations attribute counts the objective function evaluations and whose improvements
+            attribute lists how many personal bests improved in every iteration
+        """
+        options = self.options
+        swarm = Swarm(options.npart, self.dimension)
+        self.swarm = swarm
+        swarm.initialize(self.objfunc, options)
+        self.evaluations = options.npart
+        coefficients = self.schedule.coefficients
+        history = [0.0]*options.niter
+        improvements = [0]*options.niter
+        for iteration in range(1, options.niter+1):
+            w, cp, cg = coefficients(iteration)
+            improvements[iteration-1] = swarm.step(w, cp, cg, options.vmax, self.objfunc)
+            history[iteration-1] = swarm.best_values[swarm.best]
+            if observer:
+                self.global_best = history[iteration-1]
+                self.evaluations = options.npart * (iteration + 1)
+                observer(iteration, self)
+            if options.log and iteration % 10 == 0:
+                if logfunc:
+                    logfunc(iteration, history[iteration-1])
+                else:
+                    print("Iter #{}, GBEST: {}".format(iteration, history[iteration-1]))
+        d = self.dimension
+        base = swarm.best * d
+        result = PSO.Result(swarm.best_values[swarm.best], swarm.best_positions[base:base + d].tolist(), history)
+        result.evaluations = options.npart * (options.niter + 1)
+        result.improvements = improvements
+        return result
@@ -0,0 +1,190 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+def nelder_mead(objfunc, position, value, budget, step, tolerance=1e-15, stop=None):
+    """
+    Nelder-Mead simplex search started from the given position
+    Arguments:
+        objfunc(Function): Objective function
+        position(list): Starting position
+        value(float): Objective function value at the starting position
+        budget(int): Maximal number of objective function evaluations
+        step(float): Edge length of the initial simplex
+        tolerance(float): Search stops when the spread of the simplex values falls below tolerance
+        stop(Function): Called without arguments before every evaluation, the search stops when it returns True
+    Returns:
+        tuple: Best value, best position and the number of evaluations used
+    """
+    d = len(position)
+    simplex = [[x for x in position]]
+    values = [value]
+    evaluations = 0
+
+    def spent():
+        return evaluations >= budget or stop is not None and stop()
+    for i in range(d):
+        if spent():
+            break
+        vertex = [x for x in position]
+        vertex[i] += step
+        simplex.append(vertex)
+        values.append(objfunc(vertex))
+        evaluations += 1
+    if len(simplex) <= d:
+        best = min(range(len(values)), key=values.__getitem__)
+        return values[best], simplex[best], evaluations
+
+    while not spent():
+        order = sorted(range(d + 1), key=values.__getitem__)
+        simplex = [simplex[i] for i in order]
+        values = [values[i] for i in order]
+        if values[-1] - values[0] <= tolerance:
+            break
+        centroid = [sum(vertex[j] for vertex in simplex[:-1]) / d for j in range(d)]
+        worst = simplex[-1]
+        reflected = [2 * centroid[j] - worst[j] for j in range(d)]
+        reflected_value = objfunc(reflected)
+        evaluations += 1
+        if values[0] <= reflected_value < values[-2]:
+            simplex[-1], values[-1] = reflected, reflected_value
+            continue
+        if reflected_value < values[0]:
+            if spent():
+                simplex[-1], values[-1] = reflected, reflected_value
+                break
+            expanded = [3 * centroid[j] - 2 * worst[j] for j in range(d)]
+            expanded_value = objfunc(expanded)
+            evaluations += 1
+            if expanded_value < reflected_value:
+                simplex[-1], values[-1] = expanded, expanded_value
+            else:
+                simplex[-1], values[-1] = reflected, reflected_value
+            continue
+        if spent():
+            break
+        if reflected_value < values[-1]:
+            contracted = [(centroid[j] + reflected[j]) / 2 for j in range(d)]
+        else:
+            contracted = [(centroid[j] + worst[j]) / 2 for j in range(d)]
+        contracted_value = objfunc(contracted)
+        evaluations += 1
+        if contracted_value < min(reflected_value, values[-1]):
+            simplex[-1], values[-1] = contracted, contracted_value
+            continue
+        for i in range(1, d + 1):
+            if spent():
+                break
+            simplex[i] = [(simplex[0][j] + simplex[i][j]) / 2 for j in range(d)]
+            values[i] = objfunc(simplex[i])
+            evaluations += 1
+    best = min(range(d + 1), key=values.__getitem__)
+    return values[best], simplex[best], evaluations
+
+
+def pattern_search(objfunc, position, value, budget, step, tolerance=1e-15, stop=None):
+    """
+    Compass (pattern) search: polls both directions along every axis, moves to the first improvement and halves the
+    step when no poll point improves
+    Arguments:
+        objfunc(Function): Objective function
+        position(list): Starting position
+        value(float): Objective function value at the starting position
+        budget(int): Maximal number of objective function evaluations
+        step(float): Initial step length
+        tolerance(float): Search stops when the step falls below tolerance
+        stop(Function): Called without arguments before every evaluation, the search stops when it returns True
+    Returns:
+        tuple: Best value, best position and the number of evaluations used
+    """
+    best = [x for x in position]
+    evaluations = 0
+
+    def spent():
+        return evaluations >= budget or stop is not None and stop()
+    while step > tolerance and not spent():
+        improved = False
+        for i in range(len(best)):
+            for direction in (step, -step):
+                if spent():
+                    break
+                old = best[i]
+                best[i] = old + direction
+                candidate = objfunc(best)
+                evaluations += 1
+                if candidate < value:
+                    value = candidate
+                    improved = True
+                    break
+                best[i] = old
+        if not improved:
+            step /= 2
+    return value, best, evaluations
+
+
+def coordinate_descent(objfunc, position, value, budget, step, tolerance=1e-15, stop=None):
+    """
+    Derivative-free coordinate descent with a separate step length per coordinate, which is doubled after a
+    successful move along that coordinate and halved otherwise
+    Arguments:
+        objfunc(Function): Objective function
+        position(list): Starting position
+        value(float): Objective function value at the starting position
+        budget(int): Maximal number of objective function evaluations
+        step(float): Initial step length
+        tolerance(float): Search stops when all the steps fall below tolerance
+        stop(Function): Called without arguments before every evaluation, the search stops when it returns True
+    Returns:
+        tuple: Best value, best position and the number of evaluations used
+    """
+    best = [x for x in position]
+    steps = [step]*len(best)
+    evaluations = 0
+
+    def spent():
+        return evaluations >= budget or stop is not None and stop()
+    while max(steps) > tolerance and not spent():
+        for i in range(len(best)):
+            if steps[i] <= tolerance:
+                continue
+            old = best[i]
+            moved = False
+            for direction in (steps[i], -steps[i]):
+                if spent():
+                    break
+                best[i] = old + direction
+                candidate = objfunc(best)
+                evaluations += 1
+                if candidate < value:
+                    value = candidate
+                    moved = True
+                    break
+            if moved:
+                steps[i] *= 2
+            else:
+                best[i] = old
+                steps[i] /= 2
+    return value, best, evaluations
+
+
+methods = {
+    "nelder-mead": nelder_mead,
+    "pattern": pattern_search,
+    "coordinate": coordinate_descent
+}
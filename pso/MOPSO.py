@@ -0,0 +1,313 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from bisect import bisect_left, bisect_right
+from math import inf
+from pso.PSO import PSO
+from pso.Schedule import create_schedule
+import random
+
+
+def dominates(a, b):
+    """
+    Arguments:
+        a(tuple): Objective vector
+        b(tuple): Objective vector
+    Returns:
+        bool: True if a is no worse than b in every objective and better in at least one
+    """
+    better = False
+    for x, y in zip(a, b):
+        if x > y:
+            return False
+        if x < y:
+            better = True
+    return better
+
+
+def compare(a, b):
+    """
+    Dominance relation of two objective vectors in one pass, stopping as soon as they are known to be incomparable
+    Arguments:
+        a(tuple): Objective vector
+        b(tuple): Objective vector
+    Returns:
+        int: 1 if a dominates b, -1 if b dominates a, 0 if neither does or they are equal
+    """
+    better = worse = False
+    for x, y in zip(a, b):
+        if x < y:
+            better = True
+        elif x > y:
+            worse = True
+        else:
+            continue
+        if better and worse:
+            return 0
+    return 1 if better else -1 if worse else 0
+
+
+def nondominated(values):
+    """
+    Finds the non-dominated vectors. Two objectives are handled by one sort and a sweep in O(n log n). With more
+    objectives the vectors are sorted lexicographically, so a vector can only be dominated by an earlier one, and
+    each vector is compared only with the front found so far, which is O(n f) for a front of f vectors
+    Arguments:
+        values(list): Objective vectors
+    Returns:
+        list: Indices of the non-dominated vectors
+    """
+    if not values:
+        return []
+    if len(values[0]) == 2:
+        order = sorted(range(len(values)), key=values.__getitem__)
+        front = []
+        best = inf
+        for i in order:
+            if values[i][1] < best:
+                best = values[i][1]
+                front.append(i)
+        return front
+    front = []
+    for i in sorted(range(len(values)), key=values.__getitem__):
+        value = values[i]
+        if not any(dominates(values[j], value) for j in front):
+            front.append(i)
+    return sorted(front)
+
+
+def crowding_distance(values):
+    """
+    Crowding distance of every vector in a non-dominated set, the extreme vectors get infinite distance
+    Arguments:
+        values(list): Objective vectors
+    Returns:
+        list: Crowding distances
+    """
+    n = len(values)
+    distance = [0.0]*n
+    if n < 3:
+        return [inf]*n
+    for m in range(len(values[0])):
+        order = sorted(range(n), key=lambda i: values[i][m])
+        low = values[order[0]][m]
+        span = values[order[-1]][m] - low
+        distance[order[0]] = distance[order[-1]] = inf
+        if span <= 0:
+            continue
+        for k in range(1, n - 1):
+            distance[order[k]] += (values[order[k + 1]][m] - values[order[k - 1]][m]) / span
+    return distance
+
+
+class ParetoArchive(object):
+
+    def __init__(self, capacity):
+        """
+        Bounded external archive of non-dominated solutions. With two objectives the archive is kept sorted by the
+        first objective, so a dominance check is a binary search and the solutions dominated by a new one form a
+        contiguous run. When the archive overflows, the most crowded solutions are pruned
+        Arguments:
+            capacity(int): Maximal number of solutions in the archive
+        """
+        self.capacity = capacity
+        self.values = []
+        self.positions = []
+        self.keys = []
+        self.distances = None
+
+    def __len__(self):
+        return len(self.values)
+
+    def insert(self, value, position):
+        """
+        Inserts the solution if no archived solution dominates it, removing the solutions it dominates. The
+        archive may exceed its capacity until prune is called. With more than two objectives the archive is scanned
+        once, stopping at the first archived solution which dominates the new one
+        Arguments:
+            value(tuple): Objective vector
+            position(list): Position of the solution
+        Returns:
+            bool: True if the solution was inserted
+        """
+        if len(value) == 2:
+            return self.insert_sorted(value, position)
+        dominated = []
+        for i, archived in enumerate(self.values):
+            relation = compare(value, archived)
+            if relation > 0:
+                dominated.append(i)
+            elif relation < 0 or archived == value:
+                return False
+        if dominated:
+            removed = set(dominated)
+            keep = [i for i in range(len(self.values)) if i not in removed]
+            self.values = [self.values[i] for i in keep]
+            self.positions = [self.positions[i] for i in keep]
+        self.values.append(value)
+        self.positions.append([x for x in position])
+        self.distances = None
+        return True
+
+    def insert_sorted(self, value, position):
+        """
+        Insertion into a two-objective archive, which is sorted by the first objective and therefore
+        by descending second objective
+        """
+        f1, f2 = value
+        keys = self.keys
+        i = bisect_right(keys, f1)
+        if i and self.values[i - 1][1] <= f2:
+            return False
+        start = bisect_left(keys, f1)
+        end = start
+        while end < len(keys) and self.values[end][1] >= f2:
+            end += 1
+        keys[start:end] = [f1]
+        self.values[start:end] = [value]
+        self.positions[start:end] = [[x for x in position]]
+        self.distances = None
+        return True
+
+    def prune(self):
+        """
+        Removes the most crowded solutions until the archive fits its capacity
+        """
+        excess = len(self.values) - self.capacity
+        if excess <= 0:
+            return
+        distances = crowding_distance(self.values)
+        removed = set(sorted(range(len(distances)), key=distances.__getitem__)[:excess])
+        keep = [i for i in range(len(self.values)) if i not in removed]
+        self.values = [self.values[i] for i in keep]
+        self.positions = [self.positions[i] for i in keep]
+        if self.keys:
+            self.keys = [self.keys[i] for i in keep]
+        self.distances = None
+
+    def select(self):
+        """
+        Selects a leader by a binary tournament on the crowding distance, favouring sparse regions of the front
+        Returns:
+            list: Position of the leader
+        """
+        if self.distances is None:
+            self.distances = crowding_distance(self.values)
+        a = random.randrange(len(self.values))
+        b = random.randrange(len(self.values))
+        return self.positions[a if self.distances[a] >= self.distances[b] else b]
+
+
+class MOPSO(object):
+
+    def __init__(self, objfunc, dimension, opts=None, capacity=100):
+        """
+        Multi-objective PSO: every particle follows its personal best and a leader drawn from an external archive of
+        non-dominated solutions. Only static coefficient schedules are supported
+        Arguments:
+            objfunc(Function): Objective function which returns a tuple of objective values
+            dimension(int): Dimension of the problem, the number of the variables
+            opts(PSO.Options): Algorithm options, if None default options will be used
+            capacity(int): Capacity of the Pareto archive
+        """
+        self.options = opts if opts else PSO.Options()
+        self.schedule = create_schedule(self.options)
+        if self.schedule.needs_diversity or self.schedule.per_particle:
+            raise ValueError("MOPSO supports only static coefficient schedules.")
+        self.objfunc = objfunc
+        self.dimension = dimension
+        self.archive = ParetoArchive(capacity)
+        self.positions = None
+        self.velocities = None
+        self.values = None
+        self.best_positions = None
+        self.best_values = None
+
+    def optimize(self, logfunc=None):
+        """
+        Approximates the Pareto front of the objective function
+        Arguments:
+            logfunc(Function): Function which is called every 10 iterations with the iteration and the archive size
+        Returns:
+            Array which is consisted of: 1. Objective vectors of the archived non-dominated solutions
+                                         2. Positions of the archived non-dominated solutions
+                                         3. History of the archive size throughout the iterations
+        """
+        options = self.options
+        self.init_population()
+        history = [0]*options.niter
+        vmax = options.vmax
+        for iteration in range(1, options.niter + 1):
+            w, cp, cg = self.schedule.coefficients(iteration)
+            for k in range(options.npart):
+                position = self.positions[k]
+                v = self.velocities[k]
+                best = self.best_positions[k]
+                leader = self.archive.select()
+                for i in range(self.dimension):
+                    vi = w * v[i] + random.random() * cp * (best[i] - position[i]) + \
+                         random.random() * cg * (leader[i] - position[i])
+                    if vi > vmax:
+                        vi = vmax
+                    elif vi < -vmax:
+                        vi = -vmax
+                    v[i] = vi
+                    position[i] += vi
+                self.values[k] = tuple(self.objfunc(position))
+            self.update_bests()
+            history[iteration - 1] = len(self.archive)
+            if options.log and iteration % 10 == 0:
+                if logfunc:
+                    logfunc(iteration, len(self.archive))
+                else:
+                    print("Iter #{}, ARCHIVE: {}".format(iteration, len(self.archive)))
+        return [list(self.archive.values), [list(x) for x in self.archive.positions], history]
+
+    def init_population(self):
+        """
+        Initializes particle population
+        """
+        options = self.options
+        self.positions = [[random.uniform(-options.initspan, options.initspan) + options.initoffset
+                           for _ in range(self.dimension)] for _ in range(options.npart)]
+        self.velocities = [[random.uniform(-options.vspan, options.vspan) for _ in range(self.dimension)]
+                           for _ in range(options.npart)]
+        self.values = [tuple(self.objfunc(position)) for position in self.positions]
+        self.best_positions = [[x for x in position] for position in self.positions]
+        self.best_values = list(self.values)
+        for i in nondominated(self.values):
+            self.archive.insert(self.values[i], self.positions[i])
+        self.archive.prune()
+
+    def update_bests(self):
+        """
+        Updates the personal bests and feeds the non-dominated particles of the swarm into the archive.
+        A personal best is replaced if the new value dominates it, or with probability 1/2 if neither dominates
+        """
+        for k in range(len(self.values)):
+            value = self.values[k]
+            best = self.best_values[k]
+            relation = compare(value, best)
+            if relation > 0 or (relation == 0 and random.random() < 0.5):
+                self.best_values[k] = value
+                self.best_positions[k][:] = self.positions[k]
+        for i in nondominated(self.values):
+            self.archive.insert(self.values[i], self.positions[i])
+        self.archive.prune()
@@ -19,7 +19,12 @@
 """
 
 from math import inf
+from copy import copy
 from pso.Particle import Particle
+from pso.Schedule import create_schedule, diversity
+from pso.Stagnation import StagnationDetector, strategies, selections
+from pso.LocalSearch import methods
+from pso.Budget import Budget, swarm_size, iterations
 import random
 
 
@@ -43,9 +48,49 @@ class PSO(object):
             self.initoffset = 0
             self.initspan = 1
             self.vspan = 1
+            self.schedule = "linear"
+            self.perparticle = False
+            self.restart = None
+            self.restartfraction = 0.2
+            self.restartselect = "worst"
+            self.restartradius = 0.1
+            self.stallwindow = 20
+            self.stalltol = 1e-8
+            self.maxage = 50
+            self.record = None
+            self.recordevery = 1
+            self.localsearch = None
+            self.localevery = 0
+            self.localfinal = True
+            self.localbudget = 200
+            self.localstep = 0.1
+            self.evaluator = None
+            self.maxevals = None
+            self.deadline = None
+            self.autosize = False
             self.plot = False
             self.log = True
 
+    class Result(list):
+
+        def __init__(self, global_best, global_best_position, history):
+            """
+            Result of the optimization, a list of the global best evaluation, the global best position and the history
+            of the global best evaluations, which also carries the run diagnostics as attributes
+            Arguments:
+                global_best(float): Global best evaluation
+                global_best_position(list): Global best position
+                history(list): History of the global best evaluations throughout the iterations
+            """
+            super(PSO.Result, self).__init__([global_best, global_best_position, history])
+            self.reinitializations = []
+            self.trajectory = None
+            self.evaluations = 0
+            self.local_evaluations = 0
+            self.iterations = 0
+            self.expired = False
+            self.improvements = []
+
     def __init__(self, objfunc, dimension, opts=None):
         """
         Implementation of Particle Swarm Optimization algorithm
@@ -54,46 +99,146 @@ class PSO(object):
             dimension(int): Dimension of the problem, the number of the variables
             opts(PSO.Options): Algorithm options, if None default options will be used
         """
-        Particle.global_best_position = None
-        Particle.global_best = inf
+        self.global_best = inf
+        self.global_best_position = None
         self.options = opts if opts else PSO.Options()
-        self.linrate_cp = self.linear_interpolation(self.options.cpi, self.options.cpf)
-        self.linrate_cg = self.linear_interpolation(self.options.cgi, self.options.cgf)
-        self.linrate_w = self.linear_interpolation(self.options.wi, self.options.wf)
+        if self.options.maxevals is not None and self.options.maxevals < 1:
+            raise ValueError("Invalid evaluation budget '{}'. The budget must be at least 1.".format(
+                self.options.maxevals))
+        if self.options.autosize and self.options.maxevals:
+            self.options = copy(self.options)
+            self.options.npart = swarm_size(self.options.maxevals, dimension)
+        elif self.options.maxevals and self.options.npart > self.options.maxevals:
+            self.options = copy(self.options)
+            self.options.npart = self.options.maxevals
+        self.niter = iterations(self.options)
+        self.schedule = create_schedule(self.options, self.niter)
+        self.budget = None
+        self.stagnation = None
+        self.reinitializations = []
+        self.evaluations = 0
+        self.local_evaluations = 0
+        self.improvements = []
         self.particles = None
         self.dimension = dimension
         self.objfunc = objfunc
 
-    def optimize(self, logfunc=None):
+    def optimize(self, logfunc=None, observer=None):
         """
         Optimizes the objective function
         Arguments:
             logfunc(Function): Function which is called every 10 iterations
+            observer(Function): Function which is called after every iteration with the iteration and the algorithm,
+                                it must not modify the swarm
         Returns:
-            Array which is consisted of: 1. Global best evaluation
-                                         2. Global best position
-                                         3. History of the global best evaluations throughout the iterations
+            PSO.Result which is consisted of: 1. Global best evaluation
+                                              2. Global best position
+                                              3. History of the global best evaluations throughout the iterations
+            and whose reinitializations attribute lists the partial re-initializations of the swarm. If options.record
+            is set, the trajectory of the swarm is written to that file and its path is stored in the trajectory
+            attribute. The evaluations and local_evaluations attributes count the objective function evaluations
+            spent by the swarm and by the local search. An improvement by the final local search replaces the last
+            history entry and is passed to the observer once more with the last iteration.
+            If options.maxevals (evaluations, including the local search) or options.deadline (seconds) is set, the
+            run ends as soon as the budget runs out, even in the middle of an iteration, and the coefficient schedule
+            spans the budget instead of options.niter. A swarm larger than options.maxevals is shrunk to it. With only a
+            deadline options.niter is ignored and the trajectory cannot be recorded. The iterations
+            attribute holds the number of started iterations and expired tells whether the budget ran out.
+            The improvements attribute lists how many personal bests improved in every iteration, the global best
+            improved in the iterations where the history decreases
         """
+        if self.options.localsearch and self.options.localsearch not in methods:
+            raise ValueError("Unknown local search '{}'. Available methods: {}.".format(
+                self.options.localsearch, ", ".join(methods)))
+        if self.options.record and self.options.deadline is not None and not self.options.maxevals:
+            raise ValueError("Cannot record the trajectory of a run with only a deadline. Set options.maxevals to "
+                             "bound the number of iterations.")
+        self.evaluations = 0
+        self.local_evaluations = 0
+        self.improvements = []
+        self.budget = None
+        if self.options.maxevals is not None or self.options.deadline is not None:
+            self.budget = Budget(self.options.maxevals, self.options.deadline)
+        self.schedule.reset()
         self.init_population()
-        history = [0.0]*self.options.niter
-        for iteration in range(1, self.options.niter+1):
-            w = self.linrate_w(iteration)
-            cp = self.linrate_cp(iteration)
-            cg = self.linrate_cg(iteration)
-            for particle in self.particles:
-                particle.update(w, cp, cg, self.objfunc, self.options.vmax)
-            if self.options.log and iteration % 10 == 0:
-                if logfunc:
-                    logfunc(iteration, Particle.global_best)
+        self.reinitializations = []
+        if self.options.restart:
+            if self.options.restart not in strategies or self.options.restartselect not in selections:
+                raise ValueError("Unknown restart strategy '{}' or selection '{}'.".format(
+                    self.options.restart, self.options.restartselect))
+            self.stagnation = StagnationDetector(self.options.stallwindow, self.options.stalltol, self.options.maxage)
+        history = []
+        schedule = self.schedule
+        budget = self.budget
+        niter = inf if budget and not self.options.maxevals else self.niter
+        recorder = None
+        if self.options.record:
+            from pso.Recorder import TrajectoryRecorder
+            recorder = TrajectoryRecorder(self.options.record, self.niter, self.options.npart, self.dimension,
+                                          self.options.recordevery)
+        try:
+            schedule.observe(0, diversity(self.particles) if schedule.needs_diversity else None, self.global_best)
+            iteration = 0
+            while iteration < niter and not self.exhausted():
+                iteration += 1
+                if budget:
+                    w, cp, cg = schedule.at(budget.progress(self.evaluations + self.local_evaluations))
                 else:
-                    print("Iter #{}, GBEST: {}".format(iteration, Particle.global_best))
-            history[iteration-1] = Particle.global_best
-        return [Particle.global_best, Particle.global_best_position, history]
+                    w, cp, cg = schedule.coefficients(iteration)
+                if not self.step(w, cp, cg):
+                    history.append(self.global_best)
+                    break
+                schedule.observe(iteration, diversity(self.particles) if schedule.needs_diversity else None,
+                                 self.global_best)
+                if self.stagnation:
+                    count = int(self.options.restartfraction * self.options.npart)
+                    if budget:
+                        count = min(count, budget.remaining(self.evaluations + self.local_evaluations))
+                    if count and self.stagnation.update(self.global_best, self.particles, count):
+                        self.reinitialize(iteration, count)
+                if self.options.localsearch and self.options.localevery and iteration % self.options.localevery == 0 \
+                        and not self.exhausted():
+                    self.polish()
+                if recorder:
+                    recorder.record(iteration, self.particles)
+                if self.options.log and iteration % 10 == 0:
+                    if logfunc:
+                        logfunc(iteration, self.global_best)
+                    else:
+                        print("Iter #{}, GBEST: {}".format(iteration, self.global_best))
+                history.append(self.global_best)
+                if observer:
+                    observer(iteration, self)
+            if self.options.localsearch and self.options.localfinal and not self.exhausted():
+                before = self.global_best
+                self.polish()
+                if self.global_best < before:
+                    if history:
+                        history[-1] = self.global_best
+                    else:
+                        history.append(self.global_best)
+                    if observer:
+                        observer(iteration, self)
+        finally:
+            if recorder:
+                recorder.close()
+        result = PSO.Result(self.global_best, self.global_best_position, history)
+        result.reinitializations = self.reinitializations
+        result.evaluations = self.evaluations
+        result.local_evaluations = self.local_evaluations
+        result.iterations = iteration
+        result.improvements = self.improvements
+        result.expired = self.exhausted()
+        if recorder:
+            result.trajectory = self.options.record
+        return result
 
     def init_population(self):
         """
         Initializes particle population
         """
+        self.global_best = inf
+        self.global_best_position = None
         self.particles = []
         for i in range(self.options.npart):
             velocity = [0]*self.dimension
@@ -102,24 +247,164 @@ class PSO(object):
                 velocity[j] = random.uniform(-self.options.vspan, self.options.vspan)
                 position[j] = random.uniform(-self.options.initspan, self.options.initspan) + self.options.initoffset
             self.particles.append(Particle(position, velocity))
-        for particle in self.particles:
-            particle.evaluate(self.objfunc)
+        if self.options.evaluator:
+            improved = self.evaluate_particles(self.particles)
+        else:
+            improved = [particle for particle in self.particles if particle.evaluate(self.objfunc)]
+            self.evaluations += len(self.particles)
+        self.update_global_best(improved)
+
+    def step(self, w, cp, cg):
+        """
+        Moves and evaluates the swarm once against the GB of the previous iteration, then updates GB once from the
+        particles whose PB improved. Under a budget the iteration is cut short as soon as the budget runs out, the
+        particles which have not been reached keep their previous state
+        Arguments:
+            w(float): Inertia coefficient
+            cp(float): Cognitive coefficient
+            cg(float): Social coefficient
+        Returns:
+            bool: False if the iteration was cut short
+        """
+        schedule = self.schedule
+        particles = self.particles
+        inertia = schedule.particle_inertia(w, particles) if schedule.per_particle else None
+        complete = True
+        if self.options.evaluator:
+            if self.budget:
+                particles = particles[:self.budget.remaining(self.evaluations + self.local_evaluations)]
+                complete = len(particles) == len(self.particles)
+            for i, particle in enumerate(particles):
+                particle.move(inertia[i] if inertia else w, cp, cg, self.options.vmax, self.global_best_position)
+            improved = self.evaluate_particles(particles) if particles else []
+        elif self.budget:
+            improved = []
+            for i, particle in enumerate(particles):
+                if self.exhausted():
+                    complete = False
+                    break
+                if particle.update(inertia[i] if inertia else w, cp, cg, self.objfunc, self.options.vmax,
+                                   self.global_best_position):
+                    improved.append(particle)
+                self.evaluations += 1
+        elif inertia:
+            improved = [particle for i, particle in enumerate(particles)
+                        if particle.update(inertia[i], cp, cg, self.objfunc, self.options.vmax,
+                                           self.global_best_position)]
+            self.evaluations += len(particles)
+        else:
+            improved = [particle for particle in particles
+                        if particle.update(w, cp, cg, self.objfunc, self.options.vmax, self.global_best_position)]
+            self.evaluations += len(particles)
+        self.improvements.append(len(improved))
+        self.update_global_best(improved)
+        return complete
+
+    def exhausted(self):
+        """
+        Checks whether the evaluation or the wall-clock budget of the run has run out
+        Returns:
+            bool: True if the budget is spent, always False without a budget
+        """
+        return self.budget is not None and self.budget.exhausted(self.evaluations + self.local_evaluations)
 
-    def linear_interpolation(self, y0, y1):
+    def evaluate_particles(self, particles):
         """
-        Returns linear interpolation polynomial
+        Evaluates the particles as one batch with options.evaluator and updates PB
         Arguments:
-            y0(float): Initial value of some parameter
-            y1(float): Final value of some parameter
+            particles(list): Particles to evaluate
         Returns:
-            y(Function): Approximation polynomial function
+            list: Particles whose PB improved
         """
-        x0 = 1
-        x1 = self.options.niter
+        values = self.options.evaluator.evaluate(self.objfunc, [particle.position for particle in particles])
+        self.evaluations += len(particles)
+        return [particle for particle, value in zip(particles, values) if particle.assign(value)]
+
+    def update_global_best(self, improved):
+        """
+        Selects the best of the improved personal bests and makes it the global best if it is better. The global best
+        position is allocated once per run and then overwritten in place
+        Arguments:
+            improved(list): Particles whose personal best has just improved
+        """
+        if not improved:
+            return
+        best = min(improved, key=lambda particle: particle.personal_best)
+        if best.personal_best < self.global_best:
+            self.global_best = best.personal_best
+            if self.global_best_position is None:
+                self.global_best_position = [x for x in best.personal_best_position]
+            else:
+                self.global_best_position[:] = best.personal_best_position
+
+    def reinitialize(self, iteration, count):
+        """
+        Re-initializes a part of the stagnating swarm in place, selected by options.restartselect and moved by the
+        options.restart strategy. Under a budget the re-initialization stops as soon as the budget runs out. With
+        options.evaluator the re-initialized particles are evaluated by it as one batch
+        Arguments:
+            iteration(int): Current iteration
+            count(int): Number of particles to re-initialize
+        """
+        strategy = strategies[self.options.restart]
+        select = selections[self.options.restartselect]
+        before = self.global_best
+        indices = []
+        improved = []
+        for i in select(self.particles, count):
+            if self.exhausted():
+                break
+            indices.append(i)
+            particle = self.particles[i]
+            strategy(particle.position, self.global_best_position, self.options)
+            if self.options.evaluator:
+                particle.restart(self.options.vspan)
+                continue
+            if particle.reinitialize(self.objfunc, self.options.vspan):
+                improved.append(particle)
+            self.evaluations += 1
+        if self.options.evaluator and indices:
+            improved = self.evaluate_particles([self.particles[i] for i in indices])
+        self.update_global_best(improved)
+        self.stagnation.reset()
+        self.reinitializations.append({
+            "iteration": iteration,
+            "strategy": self.options.restart,
+            "particles": indices,
+            "global_best": before,
+            "improved": self.global_best < before
+        })
+
+    def polish(self):
+        """
+        Runs the options.localsearch method from the global best position under its own evaluation budget, which is
+        also limited by the budget of the run. With options.evaluator every point of the local search is evaluated by
+        it. An improvement replaces the global best and is injected into the particle with the worst personal best
+        """
+        method = methods[self.options.localsearch]
+        evaluator = self.options.evaluator
+
+        def evaluate(position):
+            return evaluator.evaluate(self.objfunc, [position])[0]
 
-        def y(x):
-            return y0 + (x - x0)*(y1-y0)/(x1-x0)
-        return y
+        objfunc = evaluate if evaluator else self.objfunc
+        budget = self.options.localbudget
+        if self.budget:
+            budget = min(budget, self.budget.remaining(self.evaluations + self.local_evaluations))
+        stop = self.budget.expired if self.budget else None
+        value, position, evaluations = method(objfunc, self.global_best_position, self.global_best, budget,
+                                              self.options.localstep, stop=stop)
+        self.local_evaluations += evaluations
+        if not value < self.global_best:
+            return
+        self.global_best = value
+        self.global_best_position[:] = position
+        worst = max(self.particles, key=lambda particle: particle.personal_best)
+        worst.position[:] = position
+        worst.value = value
+        worst.personal_best = value
+        worst.personal_best_position[:] = position
+        worst.age = 0
 
     def __str__(self):
         """
@@ -23,8 +23,6 @@ from random import uniform
 
 
 class Particle(object):
-    global_best = inf
-    global_best_position = None
 
     def __init__(self, position, v):
         """
@@ -36,24 +34,39 @@ class Particle(object):
         self.position = [x for x in position]
         self.v = [x for x in v]
         self.personal_best: float = inf
-        self.personal_best_position = None
+        self.personal_best_position = [x for x in position]
         self.value: float = inf
+        self.age = 0
 
     def evaluate(self, objfunc):
         """
-        Evaluates the objective function in the particle's position, and updates PB and GB if necessary
+        Evaluates the objective function in the particle's position, and updates PB if necessary
         Arguments:
             objfunc(Function): Objective function
+        Returns:
+            bool: True if PB improved
         """
-        self.value = objfunc(self.position)
-        if self.value < self.personal_best:
-            self.personal_best = self.value
-            self.personal_best_position = [x for x in self.position]
-        if self.personal_best < Particle.global_best:
-            Particle.global_best = self.personal_best
-            Particle.global_best_position = [x for x in self.personal_best_position]
+        return self.assign(objfunc(self.position))
 
-    def update(self, w, cp, cg, objfunc, vmax):
+    def assign(self, value):
+        """
+        Stores the objective function value of the particle's position, which may have been evaluated elsewhere,
+        and updates PB if necessary. GB is maintained by the swarm, which keeps concurrent evaluation race-free
+        Arguments:
+            value(float): Objective function value in the particle's position
+        Returns:
+            bool: True if PB improved, its position is then copied in place
+        """
+        self.value = value
+        if value < self.personal_best:
+            self.personal_best = value
+            self.personal_best_position[:] = self.position
+            self.age = 0
+            return True
+        self.age += 1
+        return False
+
+    def update(self, w, cp, cg, objfunc, vmax, global_best_position):
         """
         Updates the particle's position
         Arguments:
@@ -62,16 +75,54 @@ class Particle(object):
             cg(float): Social coefficient
             objfunc(Function): Objective function
             vmax(float): Maximal velocity that a particle can have
+            global_best_position(list): Global best position of the swarm
+        Returns:
+            bool: True if PB improved
+        """
+        self.move(w, cp, cg, vmax, global_best_position)
+        return self.evaluate(objfunc)
+
+    def move(self, w, cp, cg, vmax, global_best_position):
+        """
+        Updates the particle's velocity and position without evaluating the objective function
+        Arguments:
+            w(float): Inertia coefficient
+            cp(float): Cognitive coefficient
+            cg(float): Social coefficient
+            vmax(float): Maximal velocity that a particle can have
+            global_best_position(list): Global best position of the swarm
         """
         for i in range(len(self.position)):
             rp = uniform(0, 1)
             rg = uniform(0, 1)
             self.v[i] = w * self.v[i] + rp * cp * (self.personal_best_position[i] - self.position[i]) + rg * cg * (
-                    Particle.global_best_position[i] - self.position[i])
+                    global_best_position[i] - self.position[i])
             sign = 1 if self.v[i] > 0 else -1
             self.v[i] = min(vmax, abs(self.v[i])) * sign
             self.position[i] = self.position[i] + self.v[i]
-        self.evaluate(objfunc)
+
+    def restart(self, vspan):
+        """
+        Restarts the particle from its current (already overwritten) position, reusing its buffers. The velocity is
+        drawn again and the personal best is forgotten, the particle still has to be evaluated
+        Arguments:
+            vspan(float): Span of the initial velocity
+        """
+        for i in range(len(self.v)):
+            self.v[i] = uniform(-vspan, vspan)
+        self.personal_best = inf
+
+    def reinitialize(self, objfunc, vspan):
+        """
+        Restarts the particle from its current (already overwritten) position and evaluates it
+        Arguments:
+            objfunc(Function): Objective function
+            vspan(float): Span of the initial velocity
+        Returns:
+            bool: True if PB improved, which it does unless the objective function is infinite
+        """
+        self.restart(vspan)
+        return self.evaluate(objfunc)
 
     def __str__(self):
         """
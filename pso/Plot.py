@@ -0,0 +1,36 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+import matplotlib.pyplot as plt
+
+
+def plot_history(history, function):
+    """
+    Plots the global best throughout the iterations of the optimization process. The module imports matplotlib, so it
+    should only be imported when plotting is requested
+    Arguments:
+        history(list): List of global bests throughout the iterations
+        function(str): Name of the objective function
+    """
+    plt.scatter([_ for _ in range(1, len(history) + 1)], history, marker='x')
+    plt.title("{} function".format(function))
+    plt.xlabel("Iteration")
+    plt.ylabel("Global best")
+    plt.show()
@@ -0,0 +1,236 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from struct import Struct
+import json
+import mmap
+import sys
+
+MAGIC = b"PSOTRAJ1"
+PREFIX = Struct("<8sII")
+ALIGNMENT = 8
+
+
+class TrajectoryRecorder(object):
+
+    def __init__(self, path, niter, npart, dimension, every=1):
+        """
+        Streams the positions, velocities and values of the swarm into a preallocated memory-mapped file.
+        The file starts with the magic bytes, the header length and the number of recorded iterations, followed by
+        a JSON header and the little-endian float64 blocks positions(records, npart, dimension),
+        velocities(records, npart, dimension) and values(records, npart), whose byte offsets are stored in the header
+        Arguments:
+            path(str): Path of the trajectory file, overwritten if it exists
+            niter(int): Number of iterations of the optimization
+            npart(int): Number of particles
+            dimension(int): Dimension of the problem
+            every(int): Every n-th iteration is recorded
+        """
+        self.path = path
+        self.every = every
+        self.npart = npart
+        self.dimension = dimension
+        self.records = niter // every
+        self.count = 0
+        block = self.records * npart * dimension * 8
+        header = {
+            "version": 1,
+            "niter": niter,
+            "npart": npart,
+            "dimension": dimension,
+            "every": every,
+            "records": self.records,
+            "dtype": "<f8",
+            "positions": 0,
+            "velocities": block,
+            "values": 2 * block
+        }
+        text = json.dumps(header).encode("utf-8")
+        self.data_offset = self.align(PREFIX.size + len(text) + 64)
+        for field in ("positions", "velocities", "values"):
+            header[field] += self.data_offset
+        text = json.dumps(header).encode("utf-8")
+        self.positions_offset = header["positions"]
+        self.velocities_offset = header["velocities"]
+        self.values_offset = header["values"]
+        size = self.values_offset + self.records * npart * 8
+        self.row = Struct("<{}d".format(dimension))
+        self.value_row = Struct("<{}d".format(npart))
+        self.file = open(path, "w+b")
+        self.file.truncate(max(size, ALIGNMENT))
+        self.map = mmap.mmap(self.file.fileno(), max(size, ALIGNMENT))
+        PREFIX.pack_into(self.map, 0, MAGIC, len(text), 0)
+        self.map[PREFIX.size:PREFIX.size + len(text)] = text
+
+    @staticmethod
+    def align(offset):
+        """
+        Rounds the byte offset up to the float64 alignment
+        """
+        return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+    def record(self, iteration, particles):
+        """
+        Records the state of the swarm if the iteration is one of the recorded ones
+        Arguments:
+            iteration(int): Current iteration, starting from 1
+            particles(list): Particles of the swarm
+        """
+        if iteration % self.every or self.count >= self.records:
+            return
+        pack_into = self.row.pack_into
+        target = self.map
+        stride = self.row.size
+        offset = self.positions_offset + self.count * self.npart * stride
+        v_offset = self.velocities_offset + self.count * self.npart * stride
+        for particle in particles:
+            pack_into(target, offset, *particle.position)
+            pack_into(target, v_offset, *particle.v)
+            offset += stride
+            v_offset += stride
+        self.value_row.pack_into(target, self.values_offset + self.count * self.value_row.size,
+                                 *[particle.value for particle in particles])
+        self.count += 1
+
+    def close(self):
+        """
+        Stores the number of recorded iterations, flushes and closes the file
+        """
+        if self.map is None:
+            return
+        PREFIX.pack_into(self.map, 0, MAGIC, PREFIX.unpack_from(self.map, 0)[1], self.count)
+        self.map.flush()
+        self.map.close()
+        self.file.close()
+        self.map = None
+
+
+class Trajectory(object):
+
+    def __init__(self, path):
+        """
+        Lazily opens a trajectory written by TrajectoryRecorder. Nothing is loaded into memory, the requested parts
+        are read from the memory-mapped file on access. With NumPy the blocks can also be opened directly, e.g.
+        numpy.memmap(path, dtype="<f8", mode="r", offset=trajectory.header["positions"],
+        shape=(len(trajectory), npart, dimension))
+        Arguments:
+            path(str): Path of the trajectory file
+        """
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, length, self.count = PREFIX.unpack_from(self.map, 0)
+        if magic != MAGIC:
+            raise ValueError("{} is not a pso trajectory file.".format(path))
+        self.header = json.loads(self.map[PREFIX.size:PREFIX.size + length].decode("utf-8"))
+        self.npart = self.header["npart"]
+        self.dimension = self.header["dimension"]
+        if sys.byteorder == "little":
+            self.data = memoryview(self.map).cast("d")
+            self.row = None
+        else:
+            self.data = None
+            self.row = Struct("<{}d".format(self.dimension))
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def iteration(self, record):
+        """
+        Arguments:
+            record(int): Index of the record
+        Returns:
+            int: Iteration at which the record was taken
+        """
+        return (record + 1) * self.header["every"]
+
+    def read(self, offset, n):
+        """
+        Reads n float64 values starting at the given byte offset
+        """
+        if self.data is not None:
+            start = offset // 8
+            return self.data[start:start + n].tolist()
+        return list(Struct("<{}d".format(n)).unpack_from(self.map, offset))
+
+    def check(self, record):
+        """
+        Raises IndexError if the record was not written
+        """
+        if not 0 <= record < self.count:
+            raise IndexError("Record {} out of range, {} iterations were recorded.".format(record, self.count))
+
+    def position(self, record, particle):
+        """
+        Arguments:
+            record(int): Index of the record
+            particle(int): Index of the particle
+        Returns:
+            list: Position of the particle
+        """
+        self.check(record)
+        offset = self.header["positions"] + (record * self.npart + particle) * self.dimension * 8
+        return self.read(offset, self.dimension)
+
+    def velocity(self, record, particle):
+        """
+        Arguments:
+            record(int): Index of the record
+            particle(int): Index of the particle
+        Returns:
+            list: Velocity of the particle
+        """
+        self.check(record)
+        offset = self.header["velocities"] + (record * self.npart + particle) * self.dimension * 8
+        return self.read(offset, self.dimension)
+
+    def positions(self, record):
+        """
+        Arguments:
+            record(int): Index of the record
+        Returns:
+            list: Positions of all the particles
+        """
+        return [self.position(record, i) for i in range(self.npart)]
+
+    def values(self, record):
+        """
+        Arguments:
+            record(int): Index of the record
+        Returns:
+            list: Objective function values of all the particles
+        """
+        self.check(record)
+        return self.read(self.header["values"] + record * self.npart * 8, self.npart)
+
+    def close(self):
+        """
+        Closes the memory-mapped file
+        """
+        if self.data is not None:
+            self.data.release()
+            self.data = None
+        self.map.close()
+        self.file.close()
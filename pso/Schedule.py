@@ -0,0 +1,309 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from math import cos, pi, sqrt
+
+
+def diversity(particles):
+    """
+    Swarm diversity: root mean square distance of the particles to the swarm centroid. The centroid is computed
+    first and the squared deviations are summed around it, so a collapsed swarm reports exactly 0 regardless of
+    where it collapsed
+    Arguments:
+        particles(list): Particles of the swarm
+    Returns:
+        float: Root mean square distance of the particles to the swarm centroid
+    """
+    if not particles:
+        return 0.0
+    n = len(particles)
+    dimension = len(particles[0].position)
+    centroid = [0.0]*dimension
+    for particle in particles:
+        position = particle.position
+        for i in range(dimension):
+            centroid[i] += position[i]
+    for i in range(dimension):
+        centroid[i] /= n
+    variance = 0.0
+    for particle in particles:
+        position = particle.position
+        for i in range(dimension):
+            d = position[i] - centroid[i]
+            variance += d * d
+    return sqrt(variance / n)
+
+
+class Schedule(object):
+    needs_diversity = False
+
+    def __init__(self, options, niter=None):
+        """
+        Base class for the (w, cp, cg) coefficient schedules
+        Arguments:
+            options(PSO.Options): Algorithm options
+            niter(int): Number of iterations the schedule spans, if None options.niter is used
+        """
+        self.options = options
+        self.niter = niter if niter else options.niter
+        self.per_particle = options.perparticle
+
+    def coefficients(self, iteration):
+        """
+        Returns the coefficients for the given iteration
+        Arguments:
+            iteration(int): Current iteration, starting from 1
+        Returns:
+            tuple: Inertia, cognitive and social coefficient
+        """
+        raise NotImplementedError
+
+    def at(self, progress):
+        """
+        Returns the coefficients at the given fraction of the run
+        Arguments:
+            progress(float): Fraction of the run which has elapsed, between 0 and 1
+        Returns:
+            tuple: Inertia, cognitive and social coefficient
+        """
+        iteration = 1 + int(round(min(max(progress, 0.0), 1.0) * (self.niter - 1)))
+        return self.coefficients(iteration)
+
+    def observe(self, iteration, diversity, global_best):
+        """
+        Called after every iteration, adaptive schedules override it to react to the state of the swarm
+        Arguments:
+            iteration(int): Iteration which has just finished
+            diversity(float): Current swarm diversity, None if the schedule does not need it
+            global_best(float): Current global best evaluation
+        """
+        pass
+
+    def reset(self):
+        """
+        Called when a run starts, adaptive schedules override it to forget the state of the previous run
+        """
+        pass
+
+    def particle_inertia(self, w, particles):
+        """
+        Spreads the inertia coefficient across the particles by their current fitness: the best particle gets w/2
+        (exploitation) and the worst one keeps w (exploration)
+        Arguments:
+            w(float): Inertia coefficient of the current iteration
+            particles(list): Particles of the swarm
+        Returns:
+            list: Inertia coefficient of every particle
+        """
+        values = [particle.value for particle in particles]
+        fmin = min(values)
+        span = max(values) - fmin
+        if not span < float("inf") or span <= 0:
+            return [w]*len(values)
+        return [w * (0.5 + 0.5 * (value - fmin) / span) for value in values]
+
+
+class StaticSchedule(Schedule):
+
+    def __init__(self, options, niter=None):
+        """
+        Schedule whose coefficients depend only on the iteration, so they are precomputed once for the whole run
+        Arguments:
+            options(PSO.Options): Algorithm options
+            niter(int): Number of iterations the schedule spans, if None options.niter is used
+        """
+        super(StaticSchedule, self).__init__(options, niter)
+        self.w = self.precompute(options.wi, options.wf)
+        self.cp = self.precompute(options.cpi, options.cpf)
+        self.cg = self.precompute(options.cgi, options.cgf)
+
+    def ramp(self, y0, y1, t):
+        """
+        Ramp between the initial and the final value of a parameter
+        Arguments:
+            y0(float): Initial value of some parameter
+            y1(float): Final value of some parameter
+            t(float): Fraction of the run which has elapsed, between 0 and 1
+        Returns:
+            float: Value of the parameter
+        """
+        raise NotImplementedError
+
+    def precompute(self, y0, y1):
+        """
+        Evaluates the ramp for every iteration
+        Arguments:
+            y0(float): Initial value of some parameter
+            y1(float): Final value of some parameter
+        Returns:
+            list: Value of the parameter in every iteration
+        """
+        if self.niter < 2:
+            return [y0]*max(self.niter, 1)
+        return [self.ramp(y0, y1, i / (self.niter - 1)) for i in range(self.niter)]
+
+    def coefficients(self, iteration):
+        i = min(iteration, len(self.w)) - 1
+        return self.w[i], self.cp[i], self.cg[i]
+
+    def at(self, progress):
+        t = min(max(progress, 0.0), 1.0)
+        opts = self.options
+        return self.ramp(opts.wi, opts.wf, t), self.ramp(opts.cpi, opts.cpf, t), self.ramp(opts.cgi, opts.cgf, t)
+
+
+class LinearSchedule(StaticSchedule):
+
+    def ramp(self, y0, y1, t):
+        return y0 + t*(y1 - y0)
+
+
+class ExponentialSchedule(StaticSchedule):
+
+    def __init__(self, options, niter=None):
+        """
+        Geometric ramp between the initial and the final values, all of which must be positive
+        Arguments:
+            options(PSO.Options): Algorithm options
+            niter(int): Number of iterations the schedule spans, if None options.niter is used
+        """
+        for value in (options.wi, options.wf, options.cpi, options.cpf, options.cgi, options.cgf):
+            if value <= 0:
+                raise ValueError("Exponential schedule requires positive initial and final coefficients.")
+        super(ExponentialSchedule, self).__init__(options, niter)
+
+    def ramp(self, y0, y1, t):
+        return y0 * (y1 / y0) ** t
+
+
+class CosineSchedule(StaticSchedule):
+
+    def ramp(self, y0, y1, t):
+        return y1 + (y0 - y1) * (1 + cos(pi * t)) / 2
+
+
+class ConstrictionSchedule(Schedule):
+
+    def __init__(self, options, niter=None):
+        """
+        Clerc's constriction factor: constant coefficients chi, chi*cpi and chi*cgi, where cpi + cgi must exceed 4
+        Arguments:
+            options(PSO.Options): Algorithm options
+            niter(int): Number of iterations the schedule spans, if None options.niter is used
+        """
+        super(ConstrictionSchedule, self).__init__(options, niter)
+        phi = options.cpi + options.cgi
+        if phi <= 4:
+            raise ValueError("Constriction schedule requires cpi + cgi > 4.")
+        chi = 2 / abs(2 - phi - sqrt(phi * phi - 4 * phi))
+        self.constants = (chi, chi * options.cpi, chi * options.cgi)
+
+    def coefficients(self, iteration):
+        return self.constants
+
+    def at(self, progress):
+        return self.constants
+
+
+class AdaptiveSchedule(LinearSchedule):
+    needs_diversity = True
+
+    def __init__(self, options, niter=None, window=10, min_diversity=1e-6):
+        """
+        Linear schedule whose inertia reacts to the measured swarm diversity and to the global best stagnation.
+        While the global best keeps improving the inertia is lowered towards wf as the swarm contracts, which speeds up
+        the convergence. When the global best stagnates for window iterations or the swarm collapses below
+        min_diversity (relative to the initial diversity), the inertia is reset to wi so the swarm expands again
+        Arguments:
+            options(PSO.Options): Algorithm options
+            niter(int): Number of iterations the schedule spans, if None options.niter is used
+            window(int): Number of iterations without global best improvement which counts as stagnation
+            min_diversity(float): Relative diversity below which the swarm counts as collapsed
+        """
+        super(AdaptiveSchedule, self).__init__(options, niter)
+        self.window = window
+        self.min_diversity = min_diversity
+        self.initial_diversity = None
+        self.best = float("inf")
+        self.stall = 0
+        self.inertia = options.wi
+        self.progress = None
+
+    def reset(self):
+        self.initial_diversity = None
+        self.best = float("inf")
+        self.stall = 0
+        self.inertia = self.options.wi
+        self.progress = None
+
+    def coefficients(self, iteration):
+        i = min(iteration, len(self.w)) - 1
+        return self.inertia, self.cp[i], self.cg[i]
+
+    def at(self, progress):
+        self.progress = min(max(progress, 0.0), 1.0)
+        opts = self.options
+        return self.inertia, self.ramp(opts.cpi, opts.cpf, self.progress), self.ramp(opts.cgi, opts.cgf, self.progress)
+
+    def observe(self, iteration, diversity, global_best):
+        if self.initial_diversity is None:
+            self.initial_diversity = diversity if diversity > 0 else 1.0
+        if global_best < self.best:
+            self.best = global_best
+            self.stall = 0
+        else:
+            self.stall += 1
+        ratio = min(diversity / self.initial_diversity, 1.0)
+        if self.stall >= self.window or ratio < self.min_diversity:
+            self.inertia = self.options.wi
+            self.stall = 0
+        else:
+            if self.progress is None:
+                w = self.w[min(iteration, len(self.w) - 1)]
+            else:
+                w = self.ramp(self.options.wi, self.options.wf, self.progress)
+            self.inertia = self.options.wf + (w - self.options.wf) * ratio
+
+
+schedules = {
+    "linear": LinearSchedule,
+    "exponential": ExponentialSchedule,
+    "cosine": CosineSchedule,
+    "constriction": ConstrictionSchedule,
+    "adaptive": AdaptiveSchedule
+}
+
+
+def create_schedule(options, niter=None):
+    """
+    Creates the coefficient schedule selected by options.schedule
+    Arguments:
+        options(PSO.Options): Algorithm options, options.schedule is either a name or a Schedule instance
+        niter(int): Number of iterations the schedule spans, if None options.niter is used
+    Returns:
+        Schedule: Coefficient schedule
+    """
+    if isinstance(options.schedule, Schedule):
+        return options.schedule
+    try:
+        return schedules[options.schedule](options, niter)
+    except KeyError:
+        raise ValueError("Unknown schedule '{}'. Available schedules: {}.".format(
+            options.schedule, ", ".join(schedules)))
@@ -0,0 +1,150 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+
+from collections import deque
+from random import uniform
+
+
+class StagnationDetector(object):
+
+    def __init__(self, window, tolerance, max_age):
+        """
+        Detects swarm stagnation from the global best history and from the age of the particles' personal bests
+        Arguments:
+            window(int): Number of iterations in the global best history window
+            tolerance(float): Relative global best improvement over the window below which the swarm is stagnating
+            max_age(int): Number of iterations without personal best improvement after which a particle is stale
+        """
+        self.history = deque(maxlen=window + 1)
+        self.tolerance = tolerance
+        self.max_age = max_age
+
+    def update(self, global_best, particles, count):
+        """
+        Records the global best of the finished iteration and checks for stagnation. The swarm is stagnating if the
+        global best has not improved enough over the whole window, or if at least count particles are stale. Both
+        checks wait until the window has filled again after a reset, so particles which stay stale because another
+        ones were re-initialized do not trigger again in the following iterations
+        Arguments:
+            global_best(float): Current global best evaluation
+            particles(list): Particles of the swarm
+            count(int): Number of particles which would be re-initialized
+        Returns:
+            bool: True if the swarm is stagnating
+        """
+        history = self.history
+        history.append(global_best)
+        if len(history) < history.maxlen:
+            return False
+        first = history[0]
+        if first - global_best <= self.tolerance * max(1.0, abs(first)):
+            return True
+        stale = 0
+        for particle in particles:
+            if particle.age >= self.max_age:
+                stale += 1
+        return stale >= count
+
+    def reset(self):
+        """
+        Clears the global best history, called after the swarm has been re-initialized
+        """
+        self.history.clear()
+
+
+def select_worst(particles, count):
+    """
+    Selects the particles with the worst personal bests, the best particle of the swarm is never selected
+    Arguments:
+        particles(list): Particles of the swarm
+        count(int): Number of particles to select
+    Returns:
+        list: Indices of the selected particles
+    """
+    order = sorted(range(len(particles)), key=lambda i: particles[i].personal_best, reverse=True)
+    return order[:min(count, len(particles) - 1)]
+
+
+def select_oldest(particles, count):
+    """
+    Selects the particles whose personal bests have not improved for the longest time, the best particle of the swarm
+    is never selected
+    Arguments:
+        particles(list): Particles of the swarm
+        count(int): Number of particles to select
+    Returns:
+        list: Indices of the selected particles
+    """
+    best = min(range(len(particles)), key=lambda i: particles[i].personal_best)
+    order = sorted((i for i in range(len(particles)) if i != best), key=lambda i: particles[i].age, reverse=True)
+    return order[:count]
+
+
+def around_best(position, best_position, options):
+    """
+    Re-initializes the position uniformly around the global best position, in place
+    Arguments:
+        position(list): Position to overwrite
+        best_position(list): Global best position
+        options(PSO.Options): Algorithm options, restartradius*initspan is the half-width of the sampling box
+    """
+    radius = options.restartradius * options.initspan
+    for i in range(len(position)):
+        position[i] = best_position[i] + uniform(-radius, radius)
+
+
+def uniform_bounds(position, best_position, options):
+    """
+    Re-initializes the position uniformly in the initial population bounds, in place
+    Arguments:
+        position(list): Position to overwrite
+        best_position(list): Global best position
+        options(PSO.Options): Algorithm options
+    """
+    span = options.initspan
+    offset = options.initoffset
+    for i in range(len(position)):
+        position[i] = uniform(-span, span) + offset
+
+
+def opposition(position, best_position, options):
+    """
+    Opposition-based learning: moves the position to its opposite point with respect to the initial population
+    bounds, in place
+    Arguments:
+        position(list): Position to overwrite
+        best_position(list): Global best position
+        options(PSO.Options): Algorithm options
+    """
+    center = 2 * options.initoffset
+    for i in range(len(position)):
+        position[i] = center - position[i]
+
+
+strategies = {
+    "gbest": around_best,
+    "uniform": uniform_bounds,
+    "opposition": opposition
+}
+
+selections = {
+    "worst": select_worst,
+    "oldest": select_oldest
+}
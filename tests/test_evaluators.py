@@ -0,0 +1,211 @@
+"""
+    Python implementation of PSO (Particle Swarm Optimization) algorithm.
+    Copyright (C) 2019  Dušan Erdeljan, Dimitrije Karanfilović
+
+    This file is part of pso.
+
+    This program is free software: you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <https://www.gnu.org/licenses/>
+"""
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pso.PSO import PSO
+from pso.Evaluator import SerialEvaluator
+from pso.JobServer import JobServer
+
+SEED = 7
+DIMENSION = 4
+
+
+def sphere(x):
+    return sum(xi * xi for xi in x)
+
+
+def serve(address, ready):
+    """
+    Runs an evaluation worker in a child process, so the test can kill it
+    """
+    from pso.Distributed import Worker
+    worker = Worker(sphere, address)
+    ready.put(worker.address)
+    worker.serve_forever()
+
+
+def options(evaluator=None, niter=40):
+    opts = PSO.Options()
+    opts.log = False
+    opts.niter = niter
+    opts.npart = 20
+    opts.evaluator = evaluator
+    return opts
+
+
+def optimize(evaluator=None, observer=None, niter=40):
+    random.seed(SEED)
+    return PSO(sphere, DIMENSION, options(evaluator, niter)).optimize(observer=observer)
+
+
+class DistributedEvaluatorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.expected = optimize(SerialEvaluator())
+        self.processes = []
+
+    def tearDown(self):
+        for process in self.processes:
+            process.kill()
+            process.join()
+
+    def spawn(self):
+        context = multiprocessing.get_context("fork")
+        ready = context.Queue()
+        process = context.Process(target=serve, args=(("127.0.0.1", 0), ready), daemon=True)
+        process.start()
+        self.processes.append(process)
+        return ready.get(timeout=10)
+
+    def assertSameResult(self, result):
+        self.assertEqual(list(result), list(self.expected))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork")
+    def test_killed_worker(self):
+        from pso.Distributed import DistributedEvaluator
+        evaluator = DistributedEvaluator([self.spawn(), self.spawn()], timeout=5.0, retry=0.2)
+
+        def observer(iteration, pso):
+            if iteration == 10:
+                self.processes[0].kill()
+                self.processes[0].join()
+
+        try:
+            self.assertSameResult(optimize(evaluator, observer))
+            self.assertIsNone(evaluator.connections[0].sock)
+        finally:
+            evaluator.close()
+
+    def test_stalled_worker(self):
+        from pso.Distributed import DistributedEvaluator, Worker
+        stalled = threading.Event()
+
+        def slow(x):
+            if stalled.is_set():
+                time.sleep(0.5)
+            return sphere(x)
+
+        workers = [Worker(sphere, ("127.0.0.1", 0)).start(), Worker(slow, ("127.0.0.1", 0)).start()]
+        evaluator = DistributedEvaluator([worker.address for worker in workers], timeout=5.0, slowness=4.0)
+
+        def observer(iteration, pso):
+            if iteration == 10:
+                stalled.set()
+
+        try:
+            start = time.perf_counter()
+            self.assertSameResult(optimize(evaluator, observer))
+            self.assertLess(time.perf_counter() - start, 5.0)
+        finally:
+            stalled.clear()
+            evaluator.close()
+            for worker in workers:
+                worker.stop()
+
+
+class SharedMemoryEvaluatorTest(unittest.TestCase):
+
+    def test_segment_released_on_close(self):
+        from multiprocessing import shared_memory
+        from pso.Evaluator import SharedMemoryEvaluator
+        evaluator = SharedMemoryEvaluator(sphere, 20, DIMENSION, processes=2)
+        name = evaluator.segment.name
+        try:
+            result = optimize(evaluator)
+        finally:
+            evaluator.close()
+        expected = optimize(SerialEvaluator())
+        self.assertEqual(list(result), list(expected))
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+
+
+class JobServerTest(unittest.TestCase):
+
+    def test_single_job_matches_serial(self):
+        expected = optimize(SerialEvaluator())
+        with JobServer(evaluator=SerialEvaluator()) as server:
+            random.seed(SEED)
+            result = server.submit(sphere, DIMENSION, options()).result(timeout=30)
+        self.assertEqual(list(result), list(expected))
+        self.assertFalse(result.expired)
+
+    def test_priority_order(self):
+        started = []
+        release = threading.Event()
+
+        def blocker(x):
+            release.wait(10)
+            return sphere(x)
+
+        def tagged(tag):
+            def objective(x):
+                if tag not in started:
+                    started.append(tag)
+                return sphere(x)
+            return objective
+
+        with JobServer(batch=20) as server:
+            first = server.submit(blocker, DIMENSION, options(niter=1))
+            time.sleep(0.05)
+            futures = [server.submit(tagged(tag), DIMENSION, options(niter=5), priority=priority)
+                       for tag, priority in (("low", 0), ("high", 2), ("middle", 1), ("low2", 0))]
+            release.set()
+            first.result(timeout=30)
+            for future in futures:
+                future.result(timeout=30)
+        self.assertEqual(started, ["high", "middle", "low", "low2"])
+
+    def test_deadline(self):
+        release = threading.Event()
+
+        def blocker(x):
+            release.wait(10)
+            return sphere(x)
+
+        with JobServer(batch=20) as server:
+            first = server.submit(blocker, DIMENSION, options(niter=1))
+            time.sleep(0.05)
+            queued = server.submit(sphere, DIMENSION, options(niter=1000), deadline=0.05)
+            time.sleep(0.1)
+            release.set()
+            first.result(timeout=30)
+            start = time.perf_counter()
+            running = server.submit(sphere, DIMENSION, options(niter=10 ** 6), deadline=0.2)
+            result = running.result(timeout=30)
+            elapsed = time.perf_counter() - start
+            expired = queued.result(timeout=30)
+        self.assertTrue(expired.expired)
+        self.assertEqual(expired.iterations, 0)
+        self.assertTrue(result.expired)
+        self.assertLess(result.iterations, 10 ** 6)
+        self.assertLess(elapsed, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()